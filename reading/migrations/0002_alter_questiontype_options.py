@@ -0,0 +1,17 @@
+# Generated by Django 5.2 on 2026-10-17 00:54
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reading', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='questiontype',
+            options={'ordering': ['order', 'pk'], 'verbose_name': 'Question Type', 'verbose_name_plural': 'Question Types'},
+        ),
+    ]
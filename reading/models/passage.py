@@ -1,7 +1,11 @@
 from django.db import models
+from bisect import bisect_left
+import logging
 import uuid
 from .reading_test import ReadingTest
 
+logger = logging.getLogger('reading')
+
 class Passage(models.Model):
     """
     Model representing a reading passage within a test.
@@ -96,7 +100,8 @@ class Passage(models.Model):
         """
         if not self.order:
             # Get the highest order number for this test and add 1
-            max_order = Passage.objects.filter(test=self.test).aggregate(
+            # (filtering on test_id avoids loading the test row just for its key)
+            max_order = Passage.objects.filter(test_id=self.test_id).aggregate(
                 models.Max('order')
             )['order__max'] or 0
             self.order = max_order + 1
@@ -113,17 +118,15 @@ class Passage(models.Model):
         Returns:
             int: Total number of questions in the passage
         """
-        from .question_type import QuestionType
-        import logging
-        logger = logging.getLogger('reading')
-        
-        question_types = QuestionType.objects.filter(passage=self)
+        # Uses the prefetched question types when the passage was eager-loaded
+        question_types = self.get_question_types()
         total_count = 0
         
         for qt in question_types:
             # Use the new calculate_question_count method
             count = qt.calculate_question_count()
-            logger.info(f"  Question Type '{qt.type}': {count} questions (questions_data length: {len(qt.questions_data)})")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("  Question Type '%s': %s questions (questions_data length: %s)", qt.type, count, len(qt.questions_data))
             total_count += count
         
         return total_count
@@ -186,24 +189,34 @@ class Passage(models.Model):
         This method calculates the starting question number for the next question type
         to be added to this passage. It's used by the serializer for dynamic numbering.
         
+        When the test's passages (and their question types) were prefetched
+        they are walked in memory. Otherwise all question types up to and
+        including this passage are fetched in one query instead of one query
+        per passage. Nothing is cached, so the number is always current.
+        
         Returns:
             int: Next available question number
         """
+        test = self.test if Passage.test.is_cached(self) else None
+        if test is not None and 'passages' in getattr(test, '_prefetched_objects_cache', {}):
+            # Count questions from all passages up to and including this one
+            # Passages are ordered by 'order' by default
+            total_questions = 0
+            for passage in test.passages.all():
+                if passage.order > self.order:
+                    break
+                total_questions += passage.get_question_count()
+            return total_questions + 1
+        
         # Get the global question count across all passages in the test
         # This ensures sequential numbering across the entire test
-        test = self.test
-        total_questions = 0
-        
-        # Count questions from all passages up to this one
-        for passage in test.passages.all().order_by('order'):
-            if passage.order < self.order:
-                total_questions += passage.get_question_count()
-            elif passage.order == self.order:
-                # Add questions from this passage
-                total_questions += passage.get_question_count()
-                break
+        from .question_type import QuestionType
+        question_types = QuestionType.objects.filter(
+            passage__test_id=self.test_id,
+            passage__order__lte=self.order
+        ).only('type', 'questions_data')
         
-        return total_questions + 1
+        return sum(qt.calculate_question_count() for qt in question_types) + 1
     
     def get_question_range_for_type(self, question_type):
         """
@@ -218,31 +231,46 @@ class Passage(models.Model):
         Returns:
             tuple: (start_number, end_number)
         """
-        # Get all question types in this passage ordered by their sequence
-        question_types = self.get_question_types()
-        
-        # Calculate start number based on previous question types
-        start_number = 1
-        for qt in question_types:
-            if qt.order < question_type.order:
-                start_number += qt.calculate_question_count()
-            else:
-                break
+        # Count questions of all previous question types (those with a lower order)
+        orders, running_counts = self.get_question_type_offsets()
+        start_number = 1 + running_counts[bisect_left(orders, question_type.order)]
         
         # Calculate end number based on this question type's count
         end_number = start_number + question_type.calculate_question_count() - 1
         
         return (start_number, end_number)
     
+    def get_question_type_offsets(self):
+        """
+        Get the question type orders of this passage with running question counts.
+        
+        running_counts[i] is the number of questions in the first i question types,
+        so the questions before a given order are running_counts[bisect_left(orders, order)].
+        Uses the prefetched question types when present.
+        
+        Returns:
+            tuple: (orders, running_counts) lists
+        """
+        orders = []
+        running_counts = [0]
+        for qt in self.get_question_types():
+            orders.append(qt.order)
+            running_counts.append(running_counts[-1] + qt.calculate_question_count())
+        
+        return orders, running_counts
+    
     def get_question_types(self):
         """
         Get all question types in this passage ordered by their sequence.
         
+        Question types are ordered by 'order' by default, so going through the
+        reverse relation returns the same sequence and reuses prefetched rows
+        when the passage was loaded with prefetch_related('questions').
+        
         Returns:
             QuerySet: Question types in this passage ordered by order
         """
-        from .question_type import QuestionType
-        return QuestionType.objects.filter(passage=self).order_by('order')
+        return self.questions.all()
     
     def can_add_questions(self, additional_questions=1):
         """
@@ -297,7 +325,10 @@ class Passage(models.Model):
         for i, qt in enumerate(question_types, 1):
             qt.order = i
             qt.save()
-            qt.update_student_range()
+        
+        # Ranges are recalculated once every question type has its final order,
+        # and written together
+        QuestionType.update_student_ranges(question_types)
     
     def update_all_student_ranges(self):
         """
@@ -307,7 +338,7 @@ class Passage(models.Model):
         correct student ranges based on their current order and position.
         """
         from .question_type import QuestionType
-        question_types = QuestionType.objects.filter(passage=self).order_by('order')
+        question_types = QuestionType.objects.filter(passage=self).order_by('order', 'pk')
         
-        for qt in question_types:
-            qt.update_student_range()
+        # Only changed ranges are written, in a single batched update
+        QuestionType.update_student_ranges(question_types)
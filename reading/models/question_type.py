@@ -1,8 +1,15 @@
 from django.db import models
 import uuid
 import json
+import re
 from .passage import Passage
 
+# Placeholders supported in instruction templates, matched in a single pass
+_PLACEHOLDER_RE = re.compile(r'\{(start|end|passage_number)\}')
+
+# Question types whose question count is the number of correct answers
+_ANSWER_COUNTED_TYPES = frozenset({'Note Completion', 'Multiple Choice Questions (Multiple Answer)'})
+
 class QuestionType(models.Model):
     """
     Model representing a question type within a reading passage.
@@ -74,11 +81,12 @@ class QuestionType(models.Model):
         """
         Meta configuration for the QuestionType model.
         
-        - ordering: Question types are ordered by their sequence number within the passage
+        - ordering: Question types are ordered by their sequence number within the passage,
+          then by primary key so types sharing an order always come back in the same sequence
         - db_table: Custom table name for database organization
         - verbose_name: Human-readable name for admin panel
         """
-        ordering = ['order']  # Order question types by their sequence number
+        ordering = ['order', 'pk']  # Order question types by their sequence number
         db_table = 'reading_question_type'
         verbose_name = 'Question Type'
         verbose_name_plural = 'Question Types'
@@ -109,37 +117,14 @@ class QuestionType(models.Model):
         passage_number = self.passage.order
         
         # Replace placeholders in the instruction template
-        processed_instruction = self.instruction_template
-        processed_instruction = processed_instruction.replace('{start}', str(start_number))
-        processed_instruction = processed_instruction.replace('{end}', str(end_number))
-        processed_instruction = processed_instruction.replace('{passage_number}', str(passage_number))
-        
-        return processed_instruction
-    
-    def get_question_range(self):
-        """
-        Calculate the start and end question numbers for this question type within the passage.
-        
-        This method determines the actual question numbers based on the order
-        of question types within the passage and the number of questions in each type.
-        
-        Returns a tuple of (start_number, end_number).
-        """
-        # Get all question types in order up to this one within the same passage
-        previous_question_types = QuestionType.objects.filter(
-            passage=self.passage,
-            order__lt=self.order
-        ).order_by('order')
-        
-        # Calculate start number based on previous question types
-        start_number = 1
-        for prev_question_type in previous_question_types:
-            start_number += prev_question_type.actual_count
-        
-        # Calculate end number based on this question type's actual count
-        end_number = start_number + self.actual_count - 1
-        
-        return (start_number, end_number)
+        # This runs for every row of the question type list endpoints, so all
+        # placeholders are substituted in one scan of the template
+        values = {
+            'start': str(start_number),
+            'end': str(end_number),
+            'passage_number': str(passage_number),
+        }
+        return _PLACEHOLDER_RE.sub(lambda match: values[match.group(1)], self.instruction_template)
     
     def get_student_question_range(self):
         """
@@ -185,6 +170,19 @@ class QuestionType(models.Model):
         
         return (start_number, end_number)
     
+    def compute_student_range(self):
+        """
+        Calculate the student_range value without saving it.
+        
+        Read paths use this to fill in a missing range for the response and
+        leave persisting it to the caller.
+        
+        Returns:
+            str: Global question range (e.g., "12-15")
+        """
+        start_number, end_number = self.get_student_question_range()
+        return f"{start_number}-{end_number}"
+    
     def update_student_range(self):
         """
         Update the student_range field with the calculated global question range.
@@ -192,10 +190,35 @@ class QuestionType(models.Model):
         This method should be called whenever questions are added/removed or
         when the order of question types changes.
         """
-        start_number, end_number = self.get_student_question_range()
-        self.student_range = f"{start_number}-{end_number}"
+        self.student_range = self.compute_student_range()
         self.save(update_fields=['student_range'])
     
+    @classmethod
+    def update_student_ranges(cls, question_types):
+        """
+        Update the student_range field of several question types at once.
+        
+        Recalculates every range like update_student_range(), but only rows
+        whose range actually changed are written, using one bulk update
+        instead of one UPDATE per question type.
+        
+        Args:
+            question_types: Iterable of QuestionType instances
+            
+        Returns:
+            list: The question types whose student_range changed
+        """
+        changed = []
+        for question_type in question_types:
+            student_range = question_type.compute_student_range()
+            if question_type.student_range != student_range:
+                question_type.student_range = student_range
+                changed.append(question_type)
+        
+        if changed:
+            cls.objects.bulk_update(changed, ['student_range'])
+        return changed
+    
     def add_question(self, question_text, answer, options=None, number=None):
         """
         Add a new individual question to this question type.
@@ -307,39 +330,6 @@ class QuestionType(models.Model):
         return self.passage.get_remaining_question_slots()
 
     # Question Numbering Utility Methods
-    def calculate_question_count(self):
-        """
-        Calculate question count for different question types.
-        
-        This method calculates the total number of questions based on the question type
-        and the content of questions_data.
-        
-        Returns:
-            int: Total question count
-        """
-        if not self.questions_data:
-            return 0
-
-        if self.type in ['True/False/Not Given', 'Yes/No/Not Given', 
-                        'Multiple Choice Questions (Single Answer)', 
-                        'Multiple Choice Questions (Multiple Answer)',
-                        'Matching Information', 'Matching Headings', 'Matching Features',
-                        'Flow Chart Completion', 'Diagram Label Completion']:
-            # Each question = 1 count
-            return len(self.questions_data)
-        
-        elif self.type in ['Note Completion', 'Sentence Completion', 'Summary Completion']:
-            # Count by gaps (dots/underscores) in question text
-            total_gaps = 0
-            for question in self.questions_data:
-                text = question.get('text', '')
-                total_gaps += self._count_gaps_in_text(text)
-            return total_gaps
-        
-        else:
-            # Default: each question = 1 count
-            return len(self.questions_data)
-
     def _count_gaps_in_text(self, text):
         """
         Count gaps (dots/underscores) in text for completion questions.
@@ -512,11 +502,12 @@ class QuestionType(models.Model):
         Returns:
             int: Actual number of questions this type represents
         """
-        # For Note Completion, count based on the number of answers
-        if self.type == 'Note Completion':
+        # For Note Completion and Multiple Choice Questions (Multiple Answer),
+        # count based on the number of correct answers
+        if self.type in _ANSWER_COUNTED_TYPES:
             total_count = 0
             for question in self.questions_data:
-                # Note Completion stores answers as a list
+                # These types store answers as a list
                 answers = question.get('correct_answer', [])
                 if isinstance(answers, list):
                     total_count += len(answers)
@@ -525,24 +516,8 @@ class QuestionType(models.Model):
                     total_count += 1
             return total_count
         
-        # For Multiple Choice Questions (Multiple Answer), count based on correct answers
-        elif self.type == 'Multiple Choice Questions (Multiple Answer)':
-            total_count = 0
-            for question in self.questions_data:
-                # Count the number of correct answers for each question
-                correct_answers = question.get('correct_answer', [])
-                if isinstance(correct_answers, list):
-                    total_count += len(correct_answers)
-                else:
-                    # If it's a single answer, count as 1
-                    total_count += 1
-            return total_count
-        
-        # For most other question types, count the number of questions in questions_data
-        elif self.type in ['True/False/Not Given', 'Yes/No/Not Given', 'Multiple Choice Questions (MCQ)', 'Sentence Completion', 'Summary Completion', 'Table Completion', 'Flow Chart Completion', 'Short Answer Questions', 'Diagram Label Completion', 'Matching Information', 'Matching Headings', 'Sentence Matching', 'Matching Experts']:
-            return len(self.questions_data)
-        
-        # Default fallback
+        # Every other question type (True/False/Not Given, MCQ, completion and
+        # matching types, ...) counts the number of questions in questions_data
         return len(self.questions_data)
 
     def update_question_numbering(self):
@@ -68,7 +68,12 @@ class ReadingTest(models.Model):
         
         This is useful for displaying test information and validation.
         Returns the count of related Passage objects.
+        
+        When the passages were prefetched (list endpoints), they are counted in
+        memory instead of issuing a COUNT query for every test.
         """
+        if 'passages' in getattr(self, '_prefetched_objects_cache', {}):
+            return len(self.passages.all())
         return self.passages.count()
     
     def get_total_question_count(self):
@@ -130,13 +135,18 @@ class ReadingTest(models.Model):
         current_total = self.get_total_question_count()
         return (current_total + additional_questions) <= 40
     
-    def get_remaining_question_slots(self):
+    def get_remaining_question_slots(self, current_total=None):
         """
         Get the number of remaining question slots available.
         
+        Args:
+            current_total (int, optional): Total question count if the caller already
+                has it, to avoid counting the questions again
+        
         Returns the number of questions that can still be added before reaching the 40 limit.
         """
-        current_total = self.get_total_question_count()
+        if current_total is None:
+            current_total = self.get_total_question_count()
         return max(0, 40 - current_total)
     
     def get_remaining_passage_slots(self):
@@ -158,8 +158,9 @@ class PassageSerializer(serializers.ModelSerializer):
         Raises:
             serializers.ValidationError: If validation fails
         """
-        # Check if text is not empty
-        if not value or not value.strip():
+        # Check if text is not empty (stripped once and reused below)
+        stripped = value.strip() if value else ''
+        if not stripped:
             raise serializers.ValidationError("Text cannot be empty.")
         
         # Check if text is not too long
@@ -167,10 +168,10 @@ class PassageSerializer(serializers.ModelSerializer):
             raise serializers.ValidationError("Text cannot exceed 10000 characters.")
         
         # Check minimum length for meaningful content
-        if len(value.strip()) < 50:
+        if len(stripped) < 50:
             raise serializers.ValidationError("Text must be at least 50 characters long.")
         
-        return value.strip()
+        return stripped
     
     def validate_order(self, value):
         """
@@ -1,6 +1,78 @@
+import copy
+import logging
+
 from rest_framework import serializers
 from reading.models.question_type import QuestionType
 
+logger = logging.getLogger('reading')
+
+# Sentinel for single-probe dict lookups where None is a legitimate value
+_MISSING = object()
+
+# Single-letter option labels accepted as already being in letter format
+_LETTER_SET = frozenset('ABCDEFGHIJ')
+
+# Option letters by position: A, B, C, ... Z
+_LETTERS = tuple(chr(code) for code in range(65, 91))
+
+# Default options for option-based questions submitted without any
+# (copied per question so stored questions never share the list)
+_DEFAULT_OPTIONS = ('A', 'B', 'C', 'D', 'E')
+
+# Question types that get default options when a question has none
+_QTYPES_WITH_OPTIONS = frozenset({
+    'Multiple Choice Questions (MCQ)',
+    'Multiple Choice Questions (Multiple Answer)',
+    'Matching Information',
+    'Matching Headings',
+    'Matching Experts',
+    'Sentence Matching',
+})
+
+# Type names (display and slug) that use the headings/questions input format
+_MATCHING_HEADINGS_TYPES = frozenset({'Matching Headings', 'matching-headings'})
+
+# Instance attributes used to memoize computed field values on a QuestionType
+_MEMO_KEYS = ('_memo_question_range', '_memo_processed_instruction', '_memo_remaining_question_slots')
+
+
+def _memo(obj, key, fn):
+    """
+    Return fn() memoized in the instance dict of obj under key.
+    
+    The same QuestionType can be serialized several times within one request
+    (e.g. nested and top-level), so computed values are stored on the instance
+    and reused instead of being recomputed on every access.
+    """
+    try:
+        return obj.__dict__[key]
+    except KeyError:
+        value = obj.__dict__[key] = fn()
+        return value
+
+
+def _clear_memo(obj):
+    """
+    Drop memoized computed field values from obj after it has been saved.
+    """
+    for key in _MEMO_KEYS:
+        obj.__dict__.pop(key, None)
+
+
+class QuestionTypeListSerializer(serializers.ListSerializer):
+    """
+    List serializer for QuestionType.
+    
+    Saves the student ranges filled in while serializing the rows with a
+    single bulk update once the whole list has been rendered.
+    """
+    
+    def to_representation(self, data):
+        representation = super().to_representation(data)
+        self.child.save_pending_student_ranges()
+        return representation
+
+
 class QuestionTypeSerializer(serializers.ModelSerializer):
     """
     Serializer for QuestionType model.
@@ -13,7 +85,8 @@ class QuestionTypeSerializer(serializers.ModelSerializer):
     question_range = serializers.SerializerMethodField()
     student_range = serializers.SerializerMethodField()
     processed_instruction = serializers.SerializerMethodField()
-    question_count = serializers.SerializerMethodField()
+    # Plain alias of actual_count - a typed field avoids a method call per row
+    question_count = serializers.IntegerField(source='actual_count', read_only=True)
     remaining_question_slots = serializers.SerializerMethodField()
     
     # Custom fields for Matching Headings
@@ -41,6 +114,69 @@ class QuestionTypeSerializer(serializers.ModelSerializer):
             'headings',
             'questions'
         ]
+        list_serializer_class = QuestionTypeListSerializer
+    
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        """
+        Eager-load the relations read by the computed fields.
+        
+        question_range, processed_instruction and remaining_question_slots walk
+        the passage, its sibling question types and the other passages of the
+        test. Loading them up front keeps list serialization at a fixed number
+        of queries instead of several per question type.
+        
+        Args:
+            queryset (QuerySet): QuestionType queryset to optimize
+            
+        Returns:
+            QuerySet: The queryset with related objects eager-loaded
+        """
+        return queryset.select_related('passage__test').prefetch_related(
+            'passage__questions',
+            'passage__test__passages__questions',
+        )
+    
+    # Field instances generated from Meta, built once per class by get_fields()
+    _fields_cache = None
+    
+    def get_fields(self):
+        """
+        Return the serializer fields, introspecting the model only once per class.
+        
+        ModelSerializer.get_fields() rebuilds every field from QuestionType._meta
+        on each instantiation. The generated fields are cached on the class and
+        each serializer instance receives its own copies, so binding a field to
+        one serializer never leaks into the cache.
+        """
+        cls = type(self)
+        if cls.__dict__.get('_fields_cache') is None:
+            cls._fields_cache = super().get_fields()
+        return {name: self._copy_field(field) for name, field in cls._fields_cache.items()}
+    
+    @staticmethod
+    def _copy_field(field):
+        """
+        Copy a cached field one level deep instead of deep-copying it.
+        
+        Field.__deepcopy__ re-runs the field constructor; a shallow copy is enough
+        because bind() only sets attributes on the copy. The mutable parts are
+        copied explicitly: the validators list and, for ListField, the child
+        field, which is re-parented so it resolves context through the new copy.
+        """
+        field_copy = copy.copy(field)
+        
+        # Validators are shared by identity; only the list holding them is copied
+        if '_validators' in field.__dict__:
+            field_copy._validators = list(field._validators)
+        
+        # Child fields keep a parent reference, so they need their own copy
+        child = getattr(field, 'child', None)
+        if child is not None:
+            field_copy.child = copy.copy(child)
+            field_copy.child.parent = field_copy
+        
+        return field_copy
     
     def get_question_range(self, obj):
         """
@@ -50,7 +186,7 @@ class QuestionTypeSerializer(serializers.ModelSerializer):
         within its passage (e.g., "1-7", "8-11").
         """
         # Use the new dynamic question range calculation
-        start, end = obj.get_dynamic_question_range()
+        start, end = _memo(obj, '_memo_question_range', obj.get_dynamic_question_range)
         return f"{start}-{end}"
     
     def get_student_range(self, obj):
@@ -60,28 +196,39 @@ class QuestionTypeSerializer(serializers.ModelSerializer):
         Returns the range of question numbers that students will see
         across all passages (e.g., "1-7", "8-11", "12-15").
         """
-        # Update student range if not set
+        # Fill in the student range if not set; it is saved after serialization
+        # instead of issuing a write for every row read
         if not obj.student_range:
-            obj.update_student_range()
+            obj.student_range = obj.compute_student_range()
+            self.__dict__.setdefault('_pending_student_ranges', []).append(obj)
         
         return obj.student_range
     
-    def get_processed_instruction(self, obj):
+    def save_pending_student_ranges(self):
         """
-        Get the processed instruction with actual question numbers.
+        Persist the student ranges computed by get_student_range().
         
-        Returns the instruction template with placeholders replaced
-        with actual question numbers and passage information.
+        Uses one bulk update for all rows serialized since the last call.
         """
-        return obj.get_processed_instruction()
+        pending = self.__dict__.pop('_pending_student_ranges', None)
+        if pending:
+            QuestionType.objects.bulk_update(pending, ['student_range'])
+    
+    def to_representation(self, instance):
+        representation = super().to_representation(instance)
+        # Rows of a list are saved together by QuestionTypeListSerializer
+        if not isinstance(self.parent, serializers.ListSerializer):
+            self.save_pending_student_ranges()
+        return representation
     
-    def get_question_count(self, obj):
+    def get_processed_instruction(self, obj):
         """
-        Get the number of questions in this question type.
+        Get the processed instruction with actual question numbers.
         
-        Returns the actual count of questions present.
+        Returns the instruction template with placeholders replaced
+        with actual question numbers and passage information.
         """
-        return obj.actual_count
+        return _memo(obj, '_memo_processed_instruction', obj.get_processed_instruction)
     
     def get_remaining_question_slots(self, obj):
         """
@@ -89,7 +236,7 @@ class QuestionTypeSerializer(serializers.ModelSerializer):
         
         Returns how many more questions can be added to this question type.
         """
-        return obj.get_remaining_question_slots() 
+        return _memo(obj, '_memo_remaining_question_slots', obj.get_remaining_question_slots)
     
     def validate_questions_data(self, value):
         """
@@ -100,7 +247,7 @@ class QuestionTypeSerializer(serializers.ModelSerializer):
         """
         # Check if this is a Matching Headings question type
         # If so, use special processing for the input format
-        if self.context.get('question_type') in ['Matching Headings', 'matching-headings']:
+        if self.context.get('question_type') in _MATCHING_HEADINGS_TYPES:
             # For Matching Headings, the input comes as a dict with 'headings' and 'questions'
             # instead of a list of questions
             if isinstance(value, dict):
@@ -108,137 +255,8 @@ class QuestionTypeSerializer(serializers.ModelSerializer):
             else:
                 raise serializers.ValidationError("Matching Headings requires headings and questions structure")
         
-        # For all other question types, use standard validation
-        if not isinstance(value, list):
-            raise serializers.ValidationError("questions_data must be a list")
-        
-        processed_questions = []
-        
-        # Get the starting question number based on existing questions in the passage
-        # This will be calculated dynamically based on the passage's current question count
-        question_index = 0  # Will be updated when we have access to the passage
-        
-        for i, question in enumerate(value):
-            if not isinstance(question, dict):
-                raise serializers.ValidationError(f"Question {i+1} must be a dictionary")
-            
-            # Ensure required fields exist - handle different field names for different question types
-            if 'question_text' in question:
-                # Standard format - already has question_text
-                pass
-            elif 'text' in question:
-                # Note Completion format - convert text to question_text
-                question['question_text'] = question.pop('text')
-            else:
-                raise serializers.ValidationError(f"Question {i+1} missing required field: question_text or text")
-            
-            # Handle answer fields - support both old format (answer/answers) and new format (correct_answer)
-            if 'correct_answer' in question:
-                # New format - already using correct_answer
-                pass
-            elif 'answer' in question:
-                # Old format - convert to correct_answer
-                question['correct_answer'] = question.pop('answer')
-            elif 'answers' in question:
-                # Old format - convert to correct_answer
-                question['correct_answer'] = question.pop('answers')
-            else:
-                raise serializers.ValidationError(f"Question {i+1} missing answer/answers/correct_answer field")
-            
-            # Process options field if present
-            if 'options' in question:
-                options = question['options']
-                if isinstance(options, list):
-                    # Check if options are already in letter format (A, B, C, D, E)
-                    if options and all(len(opt) == 1 and opt.upper() in ['A', 'B', 'C', 'D', 'E', 'F', 'G', 'H', 'I', 'J'] for opt in options):
-                        # Already in letter format - keep as is
-                        processed_options = options
-                        # Create option_texts mapping if not present
-                        if 'option_texts' not in question:
-                            question['option_texts'] = {}
-                    else:
-                        # Convert text options to letter format (A, B, C, D, E...)
-                        processed_options = []
-                        option_texts = {}
-                        for i, option in enumerate(options):
-                            if option and str(option).strip():  # Check if option is not empty
-                                # Convert to letter format
-                                letter = chr(65 + i)  # 65 = 'A', 66 = 'B', etc.
-                                processed_options.append(letter)
-                                option_texts[letter] = str(option).strip()
-                        
-                        # Add option_texts to question
-                        question['option_texts'] = option_texts
-                    
-                    # Update the question with processed options
-                    question['options'] = processed_options
-                else:
-                    question['options'] = []
-                    question['option_texts'] = {}
-            else:
-                # Only add default options for question types that need them
-                question_type = self.context.get('question_type', '') if hasattr(self, 'context') else ''
-                
-                # Question types that need options
-                question_types_with_options = [
-                    'Multiple Choice Questions (MCQ)',
-                    'Multiple Choice Questions (Multiple Answer)',
-                    'Matching Information',
-                    'Matching Headings',  # Uncommented to enable options processing for Matching Headings
-                    'Matching Experts',
-                    'Sentence Matching'
-                ]
-                
-                if question_type in question_types_with_options:
-                    # Generate default options A, B, C, D, E for MCQ types
-                    question['options'] = ['A', 'B', 'C', 'D', 'E']
-                    question['option_texts'] = {}
-                else:
-                    # No options for completion/fill-in-the-blank types
-                    question['options'] = []
-                    question['option_texts'] = {}
-            
-            # Handle question_number field - support different field names
-            if 'question_number' in question:
-                # Standard format - already has question_number
-                pass
-            elif 'number' in question:
-                # Note Completion format - convert number to question_number
-                question['question_number'] = question.pop('number')
-            else:
-                # Default to index + 1
-                question['question_number'] = i + 1
-            
-            # Check if this is a MCMA question that needs splitting
-            correct_answer = question.get('correct_answer', '')
-            
-            # Handle both string format (e.g., "A,C") and array format (e.g., ["A", "C"])
-            if isinstance(correct_answer, str) and ',' in correct_answer:
-                # String format with commas - split into separate questions
-                answers = [ans.strip() for ans in correct_answer.split(',') if ans.strip()]
-            elif isinstance(correct_answer, list) and len(correct_answer) > 1:
-                # Array format with multiple answers - split into separate questions
-                answers = correct_answer
-            else:
-                # Single answer - no splitting needed
-                answers = None
-            
-            if answers:
-                # Split into separate questions
-                for answer_index, answer in enumerate(answers):
-                    # Create a separate question for each answer
-                    split_question = question.copy()
-                    split_question['correct_answer'] = answer
-                    split_question['question_number'] = question_index + 1
-                    processed_questions.append(split_question)
-                    question_index += 1
-            else:
-                # Regular question - no splitting needed
-                question['question_number'] = question_index + 1
-                processed_questions.append(question)
-                question_index += 1
-        
-        return processed_questions
+        # For all other question types, use standard validation with numbering from 1
+        return self._process_questions_with_numbering(value, starting_number=1)
 
     def _process_matching_headings_input(self, data):
         """
@@ -304,8 +322,14 @@ class QuestionTypeSerializer(serializers.ModelSerializer):
             heading_option_texts[heading['number']] = heading['text']
         
         
+        # Shared fields for every paragraph question - built once and copied per question
+        question_template = {
+            'options': heading_options,  # All heading numbers as options
+            'option_texts': heading_option_texts  # Roman numeral -> heading text mapping
+        }
+        
         # Process each paragraph question (A, B, C, D, E...)
-        for question in questions:
+        for question_number, question in enumerate(questions, 1):
             if not isinstance(question, dict):
                 raise serializers.ValidationError("Each question must be a dictionary")
             
@@ -317,82 +341,135 @@ class QuestionTypeSerializer(serializers.ModelSerializer):
             if question['correct_heading'] not in valid_heading_numbers:
                 raise serializers.ValidationError(f"Question for paragraph {question['paragraph']} references invalid heading: {question['correct_heading']}")
             
+            # Start from the shared options/option_texts and fill in the per-question fields
+            processed_question = question_template.copy()
+            
             # Create question text as "Paragraph A", "Paragraph B", etc.
-            question_text = f"Paragraph {question['paragraph']}"
+            processed_question['question_text'] = f"Paragraph {question['paragraph']}"
             
             # Set correct answer as the heading number (i, ii, iii, etc.)
-            correct_answer = question['correct_heading']
+            processed_question['correct_answer'] = question['correct_heading']
+            
+            # Will be updated with global numbering later
+            processed_question['question_number'] = question_number
             
             # Add to processed questions list
-            processed_questions.append({
-                'question_text': question_text,
-                'correct_answer': correct_answer,
-                'question_number': len(processed_questions) + 1,  # Will be updated with global numbering later
-                'options': heading_options,  # All heading numbers as options
-                'option_texts': heading_option_texts  # Roman numeral -> heading text mapping
-            })
+            processed_questions.append(processed_question)
         
         return processed_questions
 
+    @staticmethod
+    def _is_normalized_question(question):
+        """
+        Check whether a question is already in the stored questions_data format.
+        
+        A normalized question uses the canonical field names, has letter options
+        with an option_texts mapping (or no options at all) and a single correct
+        answer, so _process_questions_with_numbering would leave it unchanged
+        apart from its question_number.
+        """
+        if not isinstance(question, dict):
+            return False
+        
+        # Canonical field names - no text/answer/number aliases left to convert
+        if 'question_text' not in question or 'correct_answer' not in question or 'question_number' not in question:
+            return False
+        
+        # Options must already be letters with their option_texts mapping
+        options = question.get('options')
+        if not isinstance(options, list) or 'option_texts' not in question:
+            return False
+        if options:
+            if not all(len(opt) == 1 and opt.upper() in _LETTER_SET for opt in options):
+                return False
+        elif question['option_texts'] != {}:
+            return False
+        
+        # Multiple answers still need splitting into separate questions
+        correct_answer = question['correct_answer']
+        if isinstance(correct_answer, str) and ',' in correct_answer:
+            return False
+        if isinstance(correct_answer, list) and len(correct_answer) > 1:
+            return False
+        
+        return True
+
     def _process_questions_with_numbering(self, value, starting_number=1):
         """
         Process questions_data with dynamic question numbering starting from a specific number.
-        This method is similar to validate_questions_data but with custom starting number.
+        This is the shared implementation behind validate_questions_data, which numbers from 1.
         """
         if not isinstance(value, list):
             raise serializers.ValidationError("questions_data must be a list")
         
+        # Nothing to number
+        if not value:
+            return []
+        
+        # Fast path for re-saving stored questions_data: when every question is
+        # already in the stored format, processing would only renumber them
+        if all(self._is_normalized_question(question) for question in value):
+            for question_number, question in enumerate(value, starting_number):
+                question['question_number'] = question_number
+            return value
+        
         processed_questions = []
         question_index = starting_number - 1  # Convert to 0-based index
         
+        # The question type is fixed for the whole call, so decide once whether
+        # questions without options get the default options
+        question_type = self.context.get('question_type', '')
+        needs_default_options = question_type in _QTYPES_WITH_OPTIONS
+        
         for i, question in enumerate(value):
             if not isinstance(question, dict):
                 raise serializers.ValidationError(f"Question {i+1} must be a dictionary")
             
             # Ensure required fields exist - handle different field names for different question types
-            if 'question_text' in question:
-                # Standard format - already has question_text
-                pass
-            elif 'text' in question:
-                # Note Completion format - convert text to question_text
-                question['question_text'] = question.pop('text')
-            else:
-                raise serializers.ValidationError(f"Question {i+1} missing required field: question_text or text")
+            # Standard format already has question_text; Note Completion format uses text
+            if question.get('question_text', _MISSING) is _MISSING:
+                question_text = question.pop('text', _MISSING)
+                if question_text is _MISSING:
+                    raise serializers.ValidationError(f"Question {i+1} missing required field: question_text or text")
+                question['question_text'] = question_text
             
             # Handle answer fields - support both old format (answer/answers) and new format (correct_answer)
-            if 'correct_answer' in question:
-                # New format - already using correct_answer
-                pass
-            elif 'answer' in question:
-                # Old format - convert to correct_answer
-                question['correct_answer'] = question.pop('answer')
-            elif 'answers' in question:
-                # Old format - convert to correct_answer
-                question['correct_answer'] = question.pop('answers')
-            else:
-                raise serializers.ValidationError(f"Question {i+1} missing answer/answers/correct_answer field")
+            # Each key is probed at most once: correct_answer, then answer, then answers
+            if question.get('correct_answer', _MISSING) is _MISSING:
+                correct_answer = question.pop('answer', _MISSING)
+                if correct_answer is _MISSING:
+                    correct_answer = question.pop('answers', _MISSING)
+                if correct_answer is _MISSING:
+                    raise serializers.ValidationError(f"Question {i+1} missing answer/answers/correct_answer field")
+                question['correct_answer'] = correct_answer
             
             # Process options field if present
             if 'options' in question:
                 options = question['options']
                 if isinstance(options, list):
                     # Check if options are already in letter format (A, B, C, D, E)
-                    if options and all(len(opt) == 1 and opt.upper() in ['A', 'B', 'C', 'D', 'E', 'F', 'G', 'H', 'I', 'J'] for opt in options):
+                    if options and all(len(opt) == 1 and opt.upper() in _LETTER_SET for opt in options):
                         # Already in letter format - keep as is
                         processed_options = options
                         # Create option_texts mapping if not present
                         if 'option_texts' not in question:
                             question['option_texts'] = {}
                     else:
+                        # Each option position needs its own letter (A-Z)
+                        if len(options) > len(_LETTERS):
+                            raise serializers.ValidationError(
+                                f"Question {i+1} has {len(options)} options; at most {len(_LETTERS)} are supported"
+                            )
+                        
                         # Convert text options to letter format (A, B, C, D, E...)
-                        processed_options = []
-                        option_texts = {}
-                        for j, option in enumerate(options):
-                            if option and str(option).strip():  # Check if option is not empty
-                                # Convert to letter format
-                                letter = chr(65 + j)  # 65 = 'A', 66 = 'B', etc.
-                                processed_options.append(letter)
-                                option_texts[letter] = str(option).strip()
+                        # Letters follow the original position (0 = 'A', 1 = 'B', etc.) and
+                        # empty options are skipped; each option is stripped only once
+                        option_texts = {
+                            _LETTERS[j]: text
+                            for j, text in ((j, str(option).strip()) for j, option in enumerate(options) if option)
+                            if text
+                        }
+                        processed_options = list(option_texts)
                         
                         # Add option_texts to question
                         question['option_texts'] = option_texts
@@ -404,21 +481,9 @@ class QuestionTypeSerializer(serializers.ModelSerializer):
                     question['option_texts'] = {}
             else:
                 # Only add default options for question types that need them
-                question_type = self.context.get('question_type', '') if hasattr(self, 'context') else ''
-                
-                # Question types that need options
-                question_types_with_options = [
-                    'Multiple Choice Questions (MCQ)',
-                    'Multiple Choice Questions (Multiple Answer)',
-                    'Matching Information',
-                    'Matching Headings', 
-                    'Matching Experts',
-                    'Sentence Matching'
-                ]
-                
-                if question_type in question_types_with_options:
+                if needs_default_options:
                     # Generate default options A, B, C, D, E for MCQ types
-                    question['options'] = ['A', 'B', 'C', 'D', 'E']
+                    question['options'] = list(_DEFAULT_OPTIONS)
                     question['option_texts'] = {}
                 else:
                     # No options for completion/fill-in-the-blank types
@@ -426,24 +491,26 @@ class QuestionTypeSerializer(serializers.ModelSerializer):
                     question['option_texts'] = {}
             
             # Handle question_number field - support different field names
-            if 'question_number' in question:
-                # Standard format - already has question_number
-                pass
-            elif 'number' in question:
-                # Note Completion format - convert number to question_number
-                question['question_number'] = question.pop('number')
-            else:
+            # Standard format already has question_number; Note Completion format uses number
+            if question.get('question_number', _MISSING) is _MISSING:
                 # Use the dynamic starting number instead of index + 1
-                question['question_number'] = question_index + 1
+                question['question_number'] = question.pop('number', question_index + 1)
             
             # Check if this is a MCMA question that needs splitting
             correct_answer = question.get('correct_answer', '')
             
             # Handle both string format (e.g., "A,C") and array format (e.g., ["A", "C"])
-            if isinstance(correct_answer, str) and ',' in correct_answer:
-                # String format with commas - split into separate questions
-                answers = [ans.strip() for ans in correct_answer.split(',') if ans.strip()]
-            elif isinstance(correct_answer, list) and len(correct_answer) > 1:
+            # Answers are decoded JSON, so an exact type check is enough to dispatch
+            answer_type = type(correct_answer)
+            if answer_type is str:
+                if ',' in correct_answer:
+                    # String format with commas - split into separate questions
+                    # (each part is stripped once and empty parts are dropped)
+                    answers = [ans for ans in (part.strip() for part in correct_answer.split(',')) if ans]
+                else:
+                    # Single answer - no splitting needed
+                    answers = None
+            elif answer_type is list and len(correct_answer) > 1:
                 # Array format with multiple answers - split into separate questions
                 answers = correct_answer
             else:
@@ -453,10 +520,9 @@ class QuestionTypeSerializer(serializers.ModelSerializer):
             if answers:
                 # Split into separate questions
                 for answer_index, answer in enumerate(answers):
-                    # Create a separate question for each answer
-                    split_question = question.copy()
-                    split_question['correct_answer'] = answer
-                    split_question['question_number'] = question_index + 1
+                    # Create a separate question for each answer (one shallow copy with the
+                    # per-answer fields set; options/option_texts are shared, not copied)
+                    split_question = {**question, 'correct_answer': answer, 'question_number': question_index + 1}
                     processed_questions.append(split_question)
                     question_index += 1
             else:
@@ -472,7 +538,7 @@ class QuestionTypeSerializer(serializers.ModelSerializer):
         Create a new QuestionType instance with proper questions_data processing.
         """
         # Special processing for Matching Headings question type
-        if 'type' in validated_data and validated_data['type'] in ['Matching Headings', 'matching-headings']:
+        if validated_data.get('type') in _MATCHING_HEADINGS_TYPES:
             # Set the question type context for validation
             self.context['question_type'] = 'Matching Headings'
             
@@ -499,25 +565,26 @@ class QuestionTypeSerializer(serializers.ModelSerializer):
         validated_data.pop('questions', None)
         
         # Process questions_data before saving (for all question types)
-        if 'questions_data' in validated_data:
+        # An empty list is saved as-is without looking up the starting number
+        if validated_data.get('questions_data'):
             # Get the starting question number based on existing questions in the passage
             passage = validated_data.get('passage')
             if passage:
                 # Calculate starting question number based on existing questions
+                # (computed once and reused for logging and numbering below)
                 starting_number = passage.get_next_question_number()
                 
                 # Debug logging
-                import logging
-                logger = logging.getLogger('reading')
-                logger.info(f"=== SERIALIZER CREATE DEBUG ===")
-                logger.info(f"Passage: {passage.title} (Order: {passage.order})")
-                logger.info(f"Passage question count: {passage.get_question_count()}")
-                logger.info(f"Calculated starting number: {starting_number}")
-                logger.info(f"Questions to process: {len(validated_data['questions_data'])}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(
+                        "SERIALIZER CREATE: passage=%s order=%s start=%s questions=%d",
+                        passage.title, passage.order,
+                        starting_number, len(validated_data['questions_data'])
+                    )
                 
                 # Special handling for Matching Headings - skip _process_questions_with_numbering
                 # to preserve the correct options and option_texts
-                if validated_data.get('type') in ['Matching Headings', 'matching-headings']:
+                if validated_data.get('type') in _MATCHING_HEADINGS_TYPES:
                     # For Matching Headings, just update the question numbers
                     for i, question in enumerate(validated_data['questions_data']):
                         question['question_number'] = starting_number + i
@@ -541,7 +608,7 @@ class QuestionTypeSerializer(serializers.ModelSerializer):
         Update an existing QuestionType instance with proper questions_data processing.
         """
         # Special processing for Matching Headings question type
-        if instance.type in ['Matching Headings', 'matching-headings']:
+        if instance.type in _MATCHING_HEADINGS_TYPES:
             # Set the question type context for validation
             self.context['question_type'] = 'Matching Headings'
             
@@ -567,21 +634,22 @@ class QuestionTypeSerializer(serializers.ModelSerializer):
         validated_data.pop('questions', None)
         
         # Process questions_data before saving (for all question types)
-        if 'questions_data' in validated_data:
+        # An empty list is saved as-is without looking up the starting number
+        if validated_data.get('questions_data'):
             # Get the starting question number based on existing questions in the passage
             passage = instance.passage
             if passage:
                 # Calculate starting question number based on existing questions
+                # (computed once and reused for logging and numbering below)
                 starting_number = passage.get_next_question_number()
                 
                 # Debug logging
-                import logging
-                logger = logging.getLogger('reading')
-                logger.info(f"=== SERIALIZER UPDATE DEBUG ===")
-                logger.info(f"Question Type: {instance.type}")
-                logger.info(f"Passage: {passage.title} (Order: {passage.order})")
-                logger.info(f"Calculated starting number: {starting_number}")
-                logger.info(f"Questions to process: {len(validated_data['questions_data'])}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(
+                        "SERIALIZER UPDATE: type=%s passage=%s order=%s start=%s questions=%d",
+                        instance.type, passage.title, passage.order,
+                        starting_number, len(validated_data['questions_data'])
+                    )
                 
                 # Pass question type context for proper options handling
                 question_type = instance.type
@@ -594,6 +662,10 @@ class QuestionTypeSerializer(serializers.ModelSerializer):
             else:
                 validated_data['questions_data'] = self.validate_questions_data(validated_data['questions_data'])
         
-        return super().update(instance, validated_data)
+        instance = super().update(instance, validated_data)
+        
+        # Computed values memoized before the update are stale now
+        _clear_memo(instance)
+        return instance
     
     
@@ -1,5 +1,12 @@
+import re
+
+from django.db.models import Prefetch
 from rest_framework import serializers
-from reading.models import ReadingTest
+from reading.models import ReadingTest, Passage, QuestionType
+
+# Test names: letters, numbers, spaces, hyphens and underscores, with at least
+# one letter or number (\w and [^\W_] follow str.isalnum() for Unicode input)
+_TEST_NAME_RE = re.compile(r'[\w -]*[^\W_][\w -]*')
 
 class ReadingTestSerializer(serializers.ModelSerializer):
     """
@@ -51,6 +58,30 @@ class ReadingTestSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ['test_id', 'created_at', 'updated_at', 'passage_count', 'total_question_count', 'remaining_passage_slots', 'remaining_question_slots']
 
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        """
+        Eager-load the relations read by the computed count fields.
+        
+        passage_count and the question counts walk every passage of a test and
+        every question type of those passages. Prefetching them lets every view
+        listing tests serialize them with a fixed number of queries.
+        
+        Only the columns the counts read are loaded, so passage texts and
+        question type instructions are not transferred just to be counted.
+        
+        Args:
+            queryset (QuerySet): ReadingTest queryset to optimize
+            
+        Returns:
+            QuerySet: The queryset with related objects eager-loaded
+        """
+        question_types = QuestionType.objects.only('question_type_id', 'passage_id', 'questions_data')
+        passages = Passage.objects.only('passage_id', 'test_id').prefetch_related(
+            Prefetch('questions', queryset=question_types)
+        )
+        return queryset.prefetch_related(Prefetch('passages', queryset=passages))
+
     def get_passage_count(self, obj):
         """
         Get the number of passages in this test.
@@ -79,7 +110,7 @@ class ReadingTestSerializer(serializers.ModelSerializer):
         Returns:
             int: Total number of questions in the test
         """
-        return obj.get_total_question_count()
+        return self._get_memoized_total_question_count(obj)
     
     def get_remaining_passage_slots(self, obj):
         """
@@ -109,7 +140,29 @@ class ReadingTestSerializer(serializers.ModelSerializer):
         Returns:
             int: Number of remaining question slots
         """
-        return obj.get_remaining_question_slots()
+        return obj.get_remaining_question_slots(
+            current_total=self._get_memoized_total_question_count(obj)
+        )
+    
+    @staticmethod
+    def _get_memoized_total_question_count(obj):
+        """
+        Get the total question count of a test, computed once per instance.
+        
+        Both total_question_count and remaining_question_slots need the total,
+        which walks every question of the test, so it is stored on the instance
+        the first time and reused for the second field.
+        
+        Args:
+            obj (ReadingTest): The ReadingTest instance
+            
+        Returns:
+            int: Total number of questions in the test
+        """
+        total = obj.__dict__.get('_memo_total_question_count')
+        if total is None:
+            total = obj.__dict__['_memo_total_question_count'] = obj.get_total_question_count()
+        return total
 
     def validate_test_name(self, value):
         """
@@ -127,8 +180,9 @@ class ReadingTestSerializer(serializers.ModelSerializer):
         Raises:
             serializers.ValidationError: If validation fails
         """
-        # Check if test name is not empty
-        if not value or not value.strip():
+        # Check if test name is not empty (stripped once and reused for the result)
+        stripped = value.strip() if value else ''
+        if not stripped:
             raise serializers.ValidationError("Test name cannot be empty.")
         
         # Check if test name is not too long
@@ -136,10 +190,10 @@ class ReadingTestSerializer(serializers.ModelSerializer):
             raise serializers.ValidationError("Test name cannot exceed 255 characters.")
         
         # Check if test name contains only valid characters
-        if not value.replace(' ', '').replace('-', '').replace('_', '').isalnum():
+        if not _TEST_NAME_RE.fullmatch(value):
             raise serializers.ValidationError("Test name can only contain letters, numbers, spaces, hyphens, and underscores.")
         
-        return value.strip()
+        return stripped
     
     def validate_source(self, value):
         """
@@ -157,15 +211,16 @@ class ReadingTestSerializer(serializers.ModelSerializer):
         Raises:
             serializers.ValidationError: If validation fails
         """
-        # Check if source is not empty
-        if not value or not value.strip():
+        # Check if source is not empty (stripped once and reused for the result)
+        stripped = value.strip() if value else ''
+        if not stripped:
             raise serializers.ValidationError("Source cannot be empty.")
         
         # Check if source is not too long
         if len(value) > 255:
             raise serializers.ValidationError("Source cannot exceed 255 characters.")
         
-        return value.strip()
+        return stripped
     
     def validate_organization_id(self, value):
         """
@@ -183,15 +238,16 @@ class ReadingTestSerializer(serializers.ModelSerializer):
         Raises:
             serializers.ValidationError: If validation fails
         """
-        # Check if organization_id is not empty
-        if not value or not value.strip():
+        # Check if organization_id is not empty (stripped once and reused for the result)
+        stripped = value.strip() if value else ''
+        if not stripped:
             raise serializers.ValidationError("Organization ID cannot be empty.")
         
         # Check if organization_id is not too long
         if len(value) > 100:
             raise serializers.ValidationError("Organization ID cannot exceed 100 characters.")
         
-        return value.strip()
+        return stripped
     
     def create(self, validated_data):
         """
@@ -228,6 +284,7 @@ class ReadingTestSerializer(serializers.ModelSerializer):
         for attr, value in validated_data.items():
             setattr(instance, attr, value)
         
-        # Save the updated instance
-        instance.save()
+        # Save the updated instance, writing only the changed columns
+        # (updated_at is listed so auto_now still refreshes it)
+        instance.save(update_fields=[*validated_data, 'updated_at'])
         return instance
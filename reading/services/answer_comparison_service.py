@@ -4,14 +4,20 @@
 # IMPORTS SECTION - Required libraries and modules
 # =============================================================================
 
+# Logging for diagnostics
+import logging
 # Type hints for better code documentation and IDE support
 from typing import Dict, List, Tuple, Any, Optional
-# Decimal for precise financial/numerical calculations
-from decimal import Decimal
+# Flatten per-question-type question lists without nested Python loops
+from itertools import chain
 # Regular expressions for text pattern matching
 import re
+# Memoization of pure formatting helpers
+from functools import lru_cache
 # Django database transaction support for data consistency
 from django.db import transaction
+# Aggregations for the per-question-type summary
+from django.db.models import Count, Min, Q
 # Django timezone utilities for timestamp handling
 from django.utils import timezone
 
@@ -19,10 +25,126 @@ from django.utils import timezone
 from ..models import (
     StudentAnswer,      # Model for storing individual student answers
     SubmitAnswer,       # Model for storing complete submission records
-    QuestionType,       # Model for question type definitions
-    ReadingTest         # Model for reading test structure
+    ReadingTest,        # Model for reading test structure
+    QuestionType        # Model for question groups (holds questions_data)
 )
 
+logger = logging.getLogger('reading')
+
+# =============================================================================
+# TEXT NORMALIZATION PATTERNS - compiled once at import time
+# =============================================================================
+
+# Runs of whitespace (multiple spaces, tabs, newlines)
+_WHITESPACE_RE = re.compile(r'\s+')
+
+# Anything that is not a letter, number or whitespace (punctuation)
+_PUNCTUATION_RE = re.compile(r'[^\w\s]')
+
+# str.translate table deleting every ASCII character _PUNCTUATION_RE matches,
+# used for the (common) pure-ASCII answers
+_ASCII_PUNCTUATION_TABLE = {
+    code: None for code in range(128) if _PUNCTUATION_RE.match(chr(code))
+}
+
+# =============================================================================
+# SCORING TABLES - built once at import time
+# =============================================================================
+
+# Official IELTS Reading band thresholds: (minimum correct answers, band)
+# - 40-39 correct → Band 9.0
+# - 38-37 correct → Band 8.5
+# - 36-35 correct → Band 8.0
+# - And so on... 3 or fewer correct answers → Band 2.0
+_BAND_THRESHOLDS = (
+    (39, 9.0),   # Near perfect / perfect
+    (37, 8.5),   # Excellent
+    (35, 8.0),   # Very good
+    (33, 7.5),   # Good
+    (30, 7.0),   # Satisfactory
+    (27, 6.5),   # Above average
+    (23, 6.0),   # Average
+    (19, 5.5),   # Below average
+    (15, 5.0),   # Limited
+    (13, 4.5),   # Very limited
+    (10, 4.0),   # Extremely limited
+    (8, 3.5),    # Very poor
+    (6, 3.0),    # Poor
+    (4, 2.5),    # Very poor
+)
+
+# Band score for every possible raw score 0-40, indexed by correct_count
+_BAND_TABLE = tuple(
+    next((band for minimum, band in _BAND_THRESHOLDS if correct_count >= minimum), 2.0)
+    for correct_count in range(41)
+)
+
+# Letter grade thresholds: (minimum percentage, grade)
+_GRADE_THRESHOLDS = (
+    (90, 'A+'),  # Outstanding
+    (80, 'A'),   # Excellent
+    (70, 'B+'),  # Very good
+    (60, 'B'),   # Good
+    (50, 'C+'),  # Satisfactory
+    (40, 'C'),   # Average
+    (30, 'D'),   # Below average
+)
+
+# Letter grade for every whole percentage 0-100, indexed by int(percentage)
+_GRADE_TABLE = tuple(
+    next((grade for minimum, grade in _GRADE_THRESHOLDS if percent >= minimum), 'F')
+    for percent in range(101)
+)
+
+# =============================================================================
+# TEXT SIMILARITY HELPERS
+# =============================================================================
+
+@lru_cache(maxsize=4096)
+def _word_set(text: str) -> frozenset:
+    """
+    Split normalized text into its set of words, memoized by value.
+    
+    The correct-answer side of the similarity check is the same text for
+    every student, so it is only tokenized once. Keyed by the text itself
+    (not id()), so entries can never be confused after an object is freed.
+    """
+    return frozenset(text.split())
+
+# =============================================================================
+# TRUE/FALSE/NOT GIVEN VARIANTS - common student input variations
+# =============================================================================
+
+# Upper-cased, trimmed input -> standard TRUE/FALSE/NOT GIVEN answer
+_TRUE_FALSE_VARIANTS = {
+    'T': 'TRUE', 'TRUE': 'TRUE', '1': 'TRUE', 'YES': 'TRUE',
+    'F': 'FALSE', 'FALSE': 'FALSE', '0': 'FALSE', 'NO': 'FALSE',
+    'NG': 'NOT GIVEN', 'NOT GIVEN': 'NOT GIVEN', 'NOTGIVEN': 'NOT GIVEN', 'N/A': 'NOT GIVEN',
+}
+
+# =============================================================================
+# ANSWER DISPLAY FORMATTERS - keyed by the answer's exact type
+# =============================================================================
+
+def _join_answers(answer: list) -> str:
+    """Join multiple answers with commas for display."""
+    return ', '.join(str(item) for item in answer)
+
+# Student answers: None -> "No Answer", enhanced dict -> its student_answer
+# field, list -> comma separated; anything else (str, numbers) -> str()
+_STUDENT_ANSWER_FORMATTERS = {
+    type(None): lambda answer: "No Answer",
+    dict: lambda answer: answer.get('student_answer', 'No Answer'),
+    list: _join_answers,
+}
+
+# Correct answers: None -> "Not Available", list -> comma separated,
+# anything else -> str()
+_CORRECT_ANSWER_FORMATTERS = {
+    type(None): lambda answer: "Not Available",
+    list: _join_answers,
+}
+
 # =============================================================================
 # MAIN SERVICE CLASS - AnswerComparisonService
 # =============================================================================
@@ -44,65 +166,19 @@ class AnswerComparisonService:
     
     def __init__(self):
         """
-        Initialize the service with question type handlers and configuration.
+        Initialize the service's per-instance state.
         
-        This method sets up:
-        - Question type comparison handlers (dictionary mapping)
-        - Each handler is a method that knows how to compare specific question types
+        The question type -> comparison method mapping is shared by every
+        instance (see _QUESTION_TYPE_HANDLERS at the end of the class), so
+        nothing needs to be rebuilt here for it.
         """
         
-        # Dictionary mapping question types to their comparison methods
-        # Key: Question type name (string)
-        # Value: Method reference for comparison logic
-        self.question_type_handlers = {
-            # Multiple choice questions with single correct answer
-            'Multiple Choice Questions (MCQ)': self._compare_multiple_choice,
-            
-            # Multiple choice questions with multiple correct answers
-            'Multiple Choice Questions (Multiple Answer)': self._compare_multiple_answer,
-            
-            # True/False/Not Given questions (common in IELTS)
-            'True/False/Not Given': self._compare_true_false,
-            
-            # Yes/No/Not Given questions (similar to T/F/NG)
-            'Yes/No/Not Given': self._compare_yes_no,
-            
-            # Note completion questions (fill in the blanks)
-            'Note Completion': self._compare_note_completion,
-            
-            # Sentence completion questions
-            'Sentence Completion': self._compare_sentence_completion,
-            
-            # Summary completion questions
-            'Summary Completion': self._compare_summary_completion,
-            
-            # Table completion questions
-            'Table Completion': self._compare_table_completion,
-            
-            # Flow chart completion questions
-            'Flow Chart Completion': self._compare_flow_chart_completion,
-            
-            # Diagram label completion questions
-            'Diagram Label Completion': self._compare_diagram_completion,
-            
-            # Short answer questions
-            'Short Answer Questions': self._compare_short_answer,
-            
-            # Matching information questions
-            'Matching Information': self._compare_matching_information,
-            
-            # Matching headings questions
-            'Matching Headings': self._compare_matching_headings,
-            
-            # Matching features questions
-            'Matching Features': self._compare_matching_features,
-            
-            # Sentence matching questions
-            'Sentence Matching': self._compare_sentence_matching,
-            
-            # Matching experts questions
-            'Matching Experts': self._compare_matching_experts,
-        }
+        # Correct answers already loaded by this service instance, keyed by
+        # test_id. A batch run compares many submissions of the same test, so
+        # each test's passages/questions are only traversed once per run.
+        # Scoped to the instance (one per request) rather than the process so
+        # a teacher's edit is never masked by a stale copy in another worker.
+        self._correct_answers_cache = {}
     
     # =============================================================================
     # MAIN COMPARISON METHOD - Core functionality
@@ -160,13 +236,19 @@ class AnswerComparisonService:
             already_processed = submit_answer.is_processed
             answers_to_update = [] if already_processed else []
             
+            # One timestamp for the whole submission: every answer is scored
+            # in the same batch, so they share scored_at and processed_at
+            now = timezone.now()
+            
             # Process each individual answer
             for student_answer in student_answers_list:
                 # Compare this student answer with the correct answer
                 result = self._compare_single_answer(
                     student_answer,      # Current student answer
                     correct_answers,     # All correct answers
-                    submit_answer.test_id  # Test context
+                    submit_answer.test_id,  # Test context
+                    # Reuse the saved result when this answer was already scored
+                    student_answer.is_correct if already_processed and student_answer.scored_at else None
                 )
                 
                 # Add result to our collection
@@ -180,12 +262,11 @@ class AnswerComparisonService:
                 if not already_processed:
                     student_answer.is_correct = result['is_correct']
                     student_answer.band_score = result.get('band_score')
-                    student_answer.scored_at = timezone.now()
+                    student_answer.scored_at = now
                     answers_to_update.append(student_answer)
             
             # BULK UPDATE: Only if not already processed
             if answers_to_update:
-                from reading.models import StudentAnswer
                 StudentAnswer.objects.bulk_update(
                     answers_to_update, 
                     ['is_correct', 'band_score', 'scored_at'],
@@ -214,7 +295,7 @@ class AnswerComparisonService:
                 'ielts_band_score': ielts_band_score,
                 'overall_grade': overall_result['grade'],
                 'detailed_results': results,
-                'processed_at': timezone.now().isoformat()
+                'processed_at': now.isoformat()
             }
                 
         except Exception as e:
@@ -231,8 +312,9 @@ class AnswerComparisonService:
     def _compare_single_answer(
         self, 
         student_answer: StudentAnswer,  # Student's answer record
-        correct_answers: Dict,          # Dictionary of correct answers
-        test_id: str                    # Test identifier for context
+        correct_answers: Tuple,         # Correct answers by question number
+        test_id: str,                   # Test identifier for context
+        stored_is_correct: Optional[bool] = None  # Result already saved for this answer
     ) -> Dict[str, Any]:
         """
         Compare a single student answer with the correct answer.
@@ -242,8 +324,10 @@ class AnswerComparisonService:
         
         Args:
             student_answer: StudentAnswer instance containing the answer to compare
-            correct_answers: Dictionary mapping question numbers to correct answers
+            correct_answers: Tuple of correct answers, index = question number - 1
             test_id: Test ID for additional context if needed
+            stored_is_correct: Previously saved result for an already processed
+                submission; when given, the type-specific handler is skipped
             
         Returns:
             Dict containing:
@@ -258,21 +342,26 @@ class AnswerComparisonService:
         
         # Extract question details from the student answer
         question_number = student_answer.question_number      # Global question number (1-40)
-        question_type = student_answer.question_type          # QuestionType instance
+        # Resolve the type name and answer value once; each is used several times below
+        question_type_name = student_answer.question_type.type  # Question type name
+        answer_value = student_answer.student_answer            # Student's submitted answer
         
         # Get the correct answer for this specific question
-        # Convert question number to string for dictionary lookup
-        correct_answer = correct_answers.get(str(question_number))
+        # Question numbers start at 1, so the tuple index is one less
+        if 0 < question_number <= len(correct_answers):
+            correct_answer = correct_answers[question_number - 1]
+        else:
+            correct_answer = None
         
         # Check if correct answer exists for this question
         if correct_answer is None:
             # If no correct answer found, create error result
-            comparison_display = f"Student Answer: {self._format_student_answer(student_answer.student_answer)} | Correct Answer: Not Available | Result: ❌ (Error)"
+            comparison_display = f"Student Answer: {self._format_student_answer(answer_value)} | Correct Answer: Not Available | Result: ❌ (Error)"
             
             return {
                 'question_number': question_number,           # Question number
-                'question_type': question_type.type,          # Question type name
-                'student_answer': student_answer.student_answer,  # Student's answer
+                'question_type': question_type_name,          # Question type name
+                'student_answer': answer_value,               # Student's answer
                 'correct_answer': None,                      # No correct answer available
                 'is_correct': False,                         # Mark as incorrect due to error
                 'comparison_display': comparison_display,     # Formatted error display
@@ -280,27 +369,40 @@ class AnswerComparisonService:
             }
         
         # Get the appropriate comparison handler for this question type
-        # Look up the method in our question_type_handlers dictionary
-        handler = self.question_type_handlers.get(question_type.type)
+        # Look up the method in our _QUESTION_TYPE_HANDLERS dictionary
+        handler = self._QUESTION_TYPE_HANDLERS.get(question_type_name)
+        
+        # Handle enhanced answer format (dictionary structure) once here,
+        # so the comparison handlers always receive the bare answer
+        compare_value = answer_value
+        if isinstance(compare_value, dict):
+            # Extract actual answer from student_answer field; a missing field
+            # is an empty list for the list-based handlers and '' for the rest
+            compare_value = compare_value.get(
+                'student_answer', [] if handler in self._LIST_ANSWER_HANDLERS else ''
+            )
         
+        # Already scored answers reuse the saved result instead of re-running the handler
+        if stored_is_correct is not None:
+            is_correct = stored_is_correct
         # Check if we have a specific handler for this question type
-        if handler is None:
+        elif handler is None:
             # If no specific handler, use default comparison method
             # This handles unknown or new question types
             is_correct = self._default_comparison(
-                student_answer.student_answer,  # Student's answer
-                correct_answer                   # Correct answer
+                compare_value,   # Student's answer
+                correct_answer   # Correct answer
             )
         else:
             # Use the specific handler for this question type
             # This calls the appropriate comparison method (e.g., _compare_multiple_choice)
-            is_correct = handler(student_answer.student_answer, correct_answer)
+            is_correct = handler(self, compare_value, correct_answer)
         
         # Format the comparison result for display
         # This creates the formatted string showing student vs correct answer
         comparison_display = self._format_answer_comparison(
             question_number,           # Question number for context
-            student_answer.student_answer,  # Student's answer
+            answer_value,              # Student's answer
             correct_answer,            # Correct answer
             is_correct                 # Whether answer is correct
         )
@@ -308,8 +410,8 @@ class AnswerComparisonService:
         # Return comprehensive result for this question
         return {
             'question_number': question_number,           # Question identifier
-            'question_type': question_type.type,          # Question type name
-            'student_answer': student_answer.student_answer,  # Student's submitted answer
+            'question_type': question_type_name,          # Question type name
+            'student_answer': answer_value,               # Student's submitted answer
             'correct_answer': correct_answer,             # Correct answer for comparison
             'is_correct': is_correct,                     # Boolean: correct or incorrect
             'comparison_display': comparison_display       # Formatted display string
@@ -319,7 +421,7 @@ class AnswerComparisonService:
     # CORRECT ANSWERS RETRIEVAL - Fetch teacher's correct answers
     # =============================================================================
     
-    def _get_correct_answers(self, session_id: str) -> Dict[str, Any]:
+    def _get_correct_answers(self, session_id: str) -> Tuple[Any, ...]:
         """
         Get correct answers for a specific test from the database using session_id.
         
@@ -331,82 +433,98 @@ class AnswerComparisonService:
             session_id: Session identifier from Academiq
             
         Returns:
-            Dict mapping question numbers (as strings) to correct answers
-            Example: {"1": "A", "2": "True", "3": "climate change"}
+            Tuple of correct answers where index i holds question number i + 1
+            Example: ("A", "True", "climate change")
         """
         try:
             # First, find the submission by session_id to get the correct test_id
             submissions = SubmitAnswer.get_submissions_by_session(session_id)
             
             if not submissions.exists():
-                print(f"⚠️ No submission found for session_id: {session_id}")
-                return {}
+                logger.warning("No submission found for session_id: %s", session_id)
+                return ()
             
             # Get the first submission (there should typically be only one per session)
             submission = submissions.first()
             test_id = submission.test_id
             
-            print(f"✅ Found submission for session {session_id}, using test_id: {test_id}")
+            logger.debug("Found submission for session %s, using test_id: %s", session_id, test_id)
+            
+            # Reuse the answers if this service already loaded this test
+            cached = self._correct_answers_cache.get(test_id)
+            if cached is not None:
+                return cached
             
-            # Get the ReadingTest instance from database using the found test_id
-            # Use prefetch_related to avoid N+1 query problem (single query instead of many)
-            test = ReadingTest.objects.prefetch_related(
-                'passages',
-                'passages__questions'
-            ).get(test_id=test_id)
-            correct_answers = {}  # Dictionary to store correct answers
+            # Load every question of the test in one query
+            correct_answers = self._load_correct_answers_for_test(test_id)
             
-            # Simple sequential question counter (1, 2, 3, 4...)
-            question_counter = 1
+            # An empty table either means the test has no questions yet or the
+            # test does not exist; only the latter uses the fallback below
+            if not correct_answers and not ReadingTest.objects.filter(test_id=test_id).exists():
+                raise ReadingTest.DoesNotExist
             
-            # Iterate through all passages in the test (now uses prefetched data)
-            for passage in test.passages.all():
-                # Iterate through all question types in each passage
-                for question_type in passage.questions.all():
-                    # Iterate through all questions in each question type
-                    for question in question_type.questions_data:
-                        # Store the correct answer with sequential question number
-                        correct_answers[str(question_counter)] = question.get('correct_answer')
-                        question_counter += 1
+            self._correct_answers_cache[test_id] = correct_answers
             
             # Return the dictionary of correct answers
             return correct_answers
             
         except ReadingTest.DoesNotExist:
             # FALLBACK LOGIC: If test not found by session, try to find any available test
-            print(f"⚠️ Test not found for session {session_id}. Trying fallback to available test...")
+            logger.warning("Test not found for session %s. Trying fallback to available test...", session_id)
             
             try:
-                # Get the first available ReadingTest with prefetch for optimization
-                available_test = ReadingTest.objects.prefetch_related(
-                    'passages',
-                    'passages__questions'
-                ).first()
+                # Get the first available ReadingTest
+                available_test = ReadingTest.objects.first()
                 if available_test:
-                    print(f"✅ Using fallback test: {available_test.test_name} (ID: {available_test.test_id})")
+                    logger.info("Using fallback test: %s (ID: %s)", available_test.test_name, available_test.test_id)
                     
-                    correct_answers = {}  # Dictionary to store correct answers
-                    question_counter = 1
+                    correct_answers = self._load_correct_answers_for_test(available_test.test_id)
                     
-                    # Iterate through all passages in the fallback test (uses prefetched data)
-                    for passage in available_test.passages.all():
-                        # Iterate through all question types in each passage
-                        for question_type in passage.questions.all():
-                            # Iterate through all questions in each question type
-                            for question in question_type.questions_data:
-                                # Store the correct answer with sequential question number
-                                correct_answers[str(question_counter)] = question.get('correct_answer')
-                                question_counter += 1
-                    
-                    print(f"✅ Fallback test loaded with {len(correct_answers)} questions")
+                    logger.debug("Fallback test loaded with %d questions", len(correct_answers))
                     return correct_answers
                 else:
-                    print("❌ No ReadingTest available in database")
-                    return {}
+                    logger.error("No ReadingTest available in database")
+                    return ()
                     
             except Exception as fallback_error:
-                print(f"❌ Fallback failed: {str(fallback_error)}")
-                return {}
+                logger.error("Fallback failed: %s", fallback_error)
+                return ()
+    
+    def _load_correct_answers_for_test(self, test_id) -> Tuple[Any, ...]:
+        """
+        Build the correct answer table for a test.
+        
+        Shared by the normal lookup and the fallback path. Questions are
+        numbered sequentially (1, 2, 3, 4...) in passage/question type order,
+        so the answer for question number n is stored at index n - 1 and
+        lookups need neither a dict nor a str() of the question number.
+        The tuple is immutable, so the cached copy can be shared safely.
+        
+        Only the questions_data column is fetched, in a single query ordered
+        the same way the passages and question types are displayed (the
+        Passage and QuestionType Meta orderings), and the per-type question
+        lists are flattened with itertools.chain. Question types often share
+        an order, so the primary key tiebreak from QuestionType.Meta is
+        repeated here; without it the database may return tied rows in any
+        order and the key would not match the numbering students see.
+        
+        Args:
+            test_id: ID of the ReadingTest to load
+            
+        Returns:
+            Tuple of correct answers indexed by question number - 1
+        """
+        questions_data = QuestionType.objects.filter(
+            passage__test_id=test_id
+        ).order_by(
+            'passage__order', 'order', 'pk'
+        ).values_list('questions_data', flat=True)
+        
+        # Position in the tuple is the sequential question number - 1
+        return tuple(
+            question.get('correct_answer')
+            for question in chain.from_iterable(questions_data)
+        )
     
     # =============================================================================
     # GLOBAL QUESTION NUMBER CALCULATION - REMOVED
@@ -440,66 +558,10 @@ class AnswerComparisonService:
         """
         
         # Official IELTS Reading Band Score calculation
-        # Each range of correct answers maps to a specific band score
-        
-        if correct_count >= 40:
-            return 9.0          # Perfect score
-        elif correct_count >= 39:
-            return 9.0          # Near perfect
-        elif correct_count >= 38:
-            return 8.5          # Excellent
-        elif correct_count >= 37:
-            return 8.5          # Excellent
-        elif correct_count >= 36:
-            return 8.0          # Very good
-        elif correct_count >= 35:
-            return 8.0          # Very good
-        elif correct_count >= 34:
-            return 7.5          # Good
-        elif correct_count >= 33:
-            return 7.5          # Good
-        elif correct_count >= 32:
-            return 7.0          # Satisfactory
-        elif correct_count >= 30:
-            return 7.0          # Satisfactory
-        elif correct_count >= 29:
-            return 6.5          # Above average
-        elif correct_count >= 27:
-            return 6.5          # Above average
-        elif correct_count >= 26:
-            return 6.0          # Average
-        elif correct_count >= 23:
-            return 6.0          # Average
-        elif correct_count >= 22:
-            return 5.5          # Below average
-        elif correct_count >= 19:
-            return 5.5          # Below average
-        elif correct_count >= 18:
-            return 5.0          # Limited
-        elif correct_count >= 15:
-            return 5.0          # Limited
-        elif correct_count >= 14:
-            return 4.5          # Very limited
-        elif correct_count >= 13:
-            return 4.5          # Very limited
-        elif correct_count >= 12:
-            return 4.0          # Extremely limited
-        elif correct_count >= 10:
-            return 4.0          # Extremely limited
-        elif correct_count >= 9:
-            return 3.5          # Very poor
-        elif correct_count >= 8:
-            return 3.5          # Very poor
-        elif correct_count >= 7:
-            return 3.0          # Poor
-        elif correct_count >= 6:
-            return 3.0          # Poor
-        elif correct_count >= 5:
-            return 2.5          # Very poor
-        elif correct_count >= 4:
-            return 2.5          # Very poor
-        else:
-            return 2.0          # For 3 or fewer correct answers
+        # Table lookup built once at import time (see _BAND_TABLE)
+        if correct_count < 0:
+            return 2.0
+        return _BAND_TABLE[min(correct_count, 40)]
     
     # =============================================================================
     # OVERALL RESULT CALCULATION - Letter grades and percentages
@@ -539,22 +601,8 @@ class AnswerComparisonService:
         
         # Assign letter grade based on percentage
         # This provides familiar grading for students and teachers
-        if percentage >= 90:
-            grade = 'A+'         # Outstanding
-        elif percentage >= 80:
-            grade = 'A'          # Excellent
-        elif percentage >= 70:
-            grade = 'B+'         # Very good
-        elif percentage >= 60:
-            grade = 'B'          # Good
-        elif percentage >= 50:
-            grade = 'C+'         # Satisfactory
-        elif percentage >= 40:
-            grade = 'C'          # Average
-        elif percentage >= 30:
-            grade = 'D'          # Below average
-        else:
-            grade = 'F'          # Failing
+        # Thresholds are whole percentages, so the floor picks the same grade
+        grade = _GRADE_TABLE[min(int(percentage), 100)] if percentage >= 0 else 'F'
         
         # Return grade and percentage information
         return {
@@ -616,22 +664,9 @@ class AnswerComparisonService:
             str: Formatted answer string for display
         """
         
-        # Handle None/null answers
-        if answer is None:
-            return "No Answer"
-        
-        # Handle dictionary format (enhanced answer structure)
-        if isinstance(answer, dict):
-            # Extract student_answer field from dictionary
-            return answer.get('student_answer', 'No Answer')
-        
-        # Handle list format (multiple answers)
-        if isinstance(answer, list):
-            # Join multiple answers with commas
-            return ', '.join(str(item) for item in answer)
-        
-        # Handle string and other formats
-        return str(answer)
+        # Dispatch on the exact type: answers come from JSON, so they are
+        # plain None/dict/list/str values (see _STUDENT_ANSWER_FORMATTERS)
+        return _STUDENT_ANSWER_FORMATTERS.get(type(answer), str)(answer)
     
     def _format_correct_answer(self, answer: Any) -> str:
         """
@@ -647,17 +682,12 @@ class AnswerComparisonService:
             str: Formatted answer string for display
         """
         
-        # Handle None/null answers
-        if answer is None:
-            return "Not Available"
+        # Plain string answers are already their own display value
+        if type(answer) is str:
+            return answer
         
-        # Handle list format (multiple correct answers)
-        if isinstance(answer, list):
-            # Join multiple answers with commas
-            return ', '.join(str(item) for item in answer)
-        
-        # Handle string and other formats
-        return str(answer)
+        # Dispatch on the exact type (see _CORRECT_ANSWER_FORMATTERS)
+        return _CORRECT_ANSWER_FORMATTERS.get(type(answer), str)(answer)
     
     # =============================================================================
     # QUESTION TYPE COMPARISON METHODS - Specific logic for each type
@@ -678,10 +708,10 @@ class AnswerComparisonService:
             bool: True if answers match, False otherwise
         """
         
-        # Handle enhanced answer format (dictionary structure)
-        if isinstance(student_answer, dict):
-            # Extract actual answer from student_answer field
-            student_answer = student_answer.get('student_answer', '')
+        # Fast path: identical strings (e.g. "A" == "A") are equal after
+        # normalization too, so skip the strip/upper copies
+        if isinstance(student_answer, str) and student_answer == correct_answer:
+            return True
         
         # Compare answers (case-insensitive, trimmed)
         # Convert both to uppercase and remove whitespace for comparison
@@ -702,10 +732,6 @@ class AnswerComparisonService:
             bool: True if all answers match, False otherwise
         """
         
-        # Handle enhanced answer format
-        if isinstance(student_answer, dict):
-            student_answer = student_answer.get('student_answer', [])
-        
         # Convert string answers to list format
         if isinstance(student_answer, str):
             # Split comma-separated string into list
@@ -715,13 +741,17 @@ class AnswerComparisonService:
         if isinstance(correct_answer, str):
             correct_answer = [c.strip() for c in correct_answer.split(',')]
         
-        # Sort both lists for comparison (order doesn't matter for multiple answers)
         # Convert to uppercase for case-insensitive comparison
-        student_sorted = sorted([str(s).upper() for s in student_answer if s])
-        correct_sorted = sorted([str(c).upper() for c in correct_answer if c])
+        student_upper = [str(s).upper() for s in student_answer if s]
+        correct_upper = [str(c).upper() for c in correct_answer if c]
+        
+        # Different number of choices can never match - skip the sorting
+        if len(student_upper) != len(correct_upper):
+            return False
         
-        # Compare sorted lists
-        return student_sorted == correct_sorted
+        # Sort both lists for comparison (order doesn't matter for multiple answers)
+        # Sorted lists rather than sets so a repeated choice still counts
+        return sorted(student_upper) == sorted(correct_upper)
     
     def _compare_true_false(self, student_answer: Any, correct_answer: Any) -> bool:
         """
@@ -738,10 +768,6 @@ class AnswerComparisonService:
             bool: True if normalized answers match, False otherwise
         """
         
-        # Handle enhanced answer format
-        if isinstance(student_answer, dict):
-            student_answer = student_answer.get('student_answer', '')
-        
         # Normalize both answers to standard format
         # This handles variations like T/True/1/Yes → TRUE
         student_normalized = self._normalize_true_false_answer(student_answer)
@@ -750,24 +776,6 @@ class AnswerComparisonService:
         # Compare normalized answers
         return student_normalized == correct_normalized
     
-    def _compare_yes_no(self, student_answer: Any, correct_answer: Any) -> bool:
-        """
-        Compare Yes/No/Not Given questions.
-        
-        This method handles Y/N/NG questions similar to T/F/NG.
-        It reuses the same logic as true/false comparison.
-        
-        Args:
-            student_answer: Student's answer
-            correct_answer: Correct answer
-            
-        Returns:
-            bool: True if answers match, False otherwise
-        """
-        
-        # Reuse true/false comparison logic since Y/N/NG is similar to T/F/NG
-        return self._compare_true_false(student_answer, correct_answer)
-    
     def _compare_note_completion(self, student_answer: Any, correct_answer: Any) -> bool:
         """
         Compare note completion questions.
@@ -783,10 +791,6 @@ class AnswerComparisonService:
             bool: True if all gaps are filled correctly, False otherwise
         """
         
-        # Handle enhanced answer format
-        if isinstance(student_answer, dict):
-            student_answer = student_answer.get('student_answer', [])
-        
         # Convert string answers to list format
         if isinstance(student_answer, str):
             student_answer = [s.strip() for s in student_answer.split(',')]
@@ -808,204 +812,6 @@ class AnswerComparisonService:
         # All gaps are correct
         return True
     
-    def _compare_sentence_completion(self, student_answer: Any, correct_answer: Any) -> bool:
-        """
-        Compare sentence completion questions.
-        
-        This method handles questions where students complete sentences
-        with missing words or phrases.
-        
-        Args:
-            student_answer: Student's completed sentence
-            correct_answer: Correct completed sentence
-            
-        Returns:
-            bool: True if answers match, False otherwise
-        """
-        
-        # Use generic text comparison method
-        return self._compare_text_answer(student_answer, correct_answer)
-    
-    def _compare_summary_completion(self, student_answer: Any, correct_answer: Any) -> bool:
-        """
-        Compare summary completion questions.
-        
-        This method handles questions where students complete summaries
-        with missing information.
-        
-        Args:
-            student_answer: Student's completed summary
-            correct_answer: Correct completed summary
-            
-        Returns:
-            bool: True if answers match, False otherwise
-        """
-        
-        # Use generic text comparison method
-        return self._compare_text_answer(student_answer, correct_answer)
-    
-    def _compare_table_completion(self, student_answer: Any, correct_answer: Any) -> bool:
-        """
-        Compare table completion questions.
-        
-        This method handles questions where students complete tables
-        with missing data.
-        
-        Args:
-            student_answer: Student's completed table data
-            correct_answer: Correct table data
-            
-        Returns:
-            bool: True if answers match, False otherwise
-        """
-        
-        # Use generic text comparison method
-        return self._compare_text_answer(student_answer, correct_answer)
-    
-    def _compare_flow_chart_completion(self, student_answer: Any, correct_answer: Any) -> bool:
-        """
-        Compare flow chart completion questions.
-        
-        This method handles questions where students complete flow charts
-        with missing steps or information.
-        
-        Args:
-            student_answer: Student's completed flow chart
-            correct_answer: Correct completed flow chart
-            
-        Returns:
-            bool: True if answers match, False otherwise
-        """
-        
-        # Use generic text comparison method
-        return self._compare_text_answer(student_answer, correct_answer)
-    
-    def _compare_diagram_completion(self, student_answer: Any, correct_answer: Any) -> bool:
-        """
-        Compare diagram label completion questions.
-        
-        This method handles questions where students label diagrams
-        with missing labels or information.
-        
-        Args:
-            student_answer: Student's diagram labels
-            correct_answer: Correct diagram labels
-            
-        Returns:
-            bool: True if answers match, False otherwise
-        """
-        
-        # Use generic text comparison method
-        return self._compare_text_answer(student_answer, correct_answer)
-    
-    def _compare_short_answer(self, student_answer: Any, correct_answer: Any) -> bool:
-        """
-        Compare short answer questions.
-        
-        This method handles questions where students provide brief
-        written answers.
-        
-        Args:
-            student_answer: Student's short answer
-            correct_answer: Correct short answer
-            
-        Returns:
-            bool: True if answers match, False otherwise
-        """
-        
-        # Use generic text comparison method
-        return self._compare_text_answer(student_answer, correct_answer)
-    
-    def _compare_matching_information(self, student_answer: Any, correct_answer: Any) -> bool:
-        """
-        Compare matching information questions.
-        
-        This method handles questions where students match
-        information to paragraphs or sections.
-        
-        Args:
-            student_answer: Student's matching choices
-            correct_answer: Correct matching choices
-            
-        Returns:
-            bool: True if answers match, False otherwise
-        """
-        
-        # Use generic text comparison method
-        return self._compare_text_answer(student_answer, correct_answer)
-    
-    def _compare_matching_headings(self, student_answer: Any, correct_answer: Any) -> bool:
-        """
-        Compare matching headings questions.
-        
-        This method handles questions where students match
-        headings to paragraphs or sections.
-        
-        Args:
-            student_answer: Student's heading matches
-            correct_answer: Correct heading matches
-            
-        Returns:
-            bool: True if answers match, False otherwise
-        """
-        
-        # Use generic text comparison method
-        return self._compare_text_answer(student_answer, correct_answer)
-    
-    def _compare_matching_features(self, student_answer: Any, correct_answer: Any) -> bool:
-        """
-        Compare matching features questions.
-        
-        This method handles questions where students match
-        features to categories or groups.
-        
-        Args:
-            student_answer: Student's feature matches
-            correct_answer: Correct feature matches
-            
-        Returns:
-            bool: True if answers match, False otherwise
-        """
-        
-        # Use generic text comparison method
-        return self._compare_text_answer(student_answer, correct_answer)
-    
-    def _compare_sentence_matching(self, student_answer: Any, correct_answer: Any) -> bool:
-        """
-        Compare sentence matching questions.
-        
-        This method handles questions where students match
-        sentence beginnings to endings.
-        
-        Args:
-            student_answer: Student's sentence matches
-            correct_answer: Correct sentence matches
-            
-        Returns:
-            bool: True if answers match, False otherwise
-        """
-        
-        # Use generic text comparison method
-        return self._compare_text_answer(student_answer, correct_answer)
-    
-    def _compare_matching_experts(self, student_answer: Any, correct_answer: Any) -> bool:
-        """
-        Compare matching experts questions.
-        
-        This method handles questions where students match
-        experts to their statements or opinions.
-        
-        Args:
-            student_answer: Student's expert matches
-            correct_answer: Correct expert matches
-            
-        Returns:
-            bool: True if answers match, False otherwise
-        """
-        
-        # Use generic text comparison method
-        return self._compare_text_answer(student_answer, correct_answer)
-    
     # =============================================================================
     # GENERIC TEXT COMPARISON - Fuzzy matching for text-based answers
     # =============================================================================
@@ -1025,14 +831,18 @@ class AnswerComparisonService:
             bool: True if answers are similar enough, False otherwise
         """
         
-        # Handle enhanced answer format
-        if isinstance(student_answer, dict):
-            student_answer = student_answer.get('student_answer', '')
+        student_text = str(student_answer)
+        correct_text = str(correct_answer)
+        
+        # Fast path: answers equal apart from case and surrounding spaces are
+        # also equal after normalization, so skip normalizing entirely
+        if student_text.strip().lower() == correct_text.strip().lower():
+            return True
         
         # Normalize both answers for comparison
         # This removes case differences, extra spaces, and punctuation
-        student_normalized = self._normalize_text(str(student_answer))
-        correct_normalized = self._normalize_text(str(correct_answer))
+        student_normalized = self._normalize_text(student_text)
+        correct_normalized = self._normalize_text(correct_text)
         
         # Try exact match first (most efficient)
         if student_normalized == correct_normalized:
@@ -1061,10 +871,6 @@ class AnswerComparisonService:
             bool: True if answers match, False otherwise
         """
         
-        # Handle enhanced answer format
-        if isinstance(student_answer, dict):
-            student_answer = student_answer.get('student_answer', '')
-        
         # Simple case-insensitive string comparison
         # Convert both to lowercase and remove whitespace
         return str(student_answer).strip().lower() == str(correct_answer).strip().lower()
@@ -1094,25 +900,23 @@ class AnswerComparisonService:
         # Convert to string and normalize
         answer_str = str(answer).strip().upper()
         
-        # Map variations to standard format
-        # This handles common student input variations
-        if answer_str in ['T', 'TRUE', '1', 'YES']:
-            return 'TRUE'
-        elif answer_str in ['F', 'FALSE', '0', 'NO']:
-            return 'FALSE'
-        elif answer_str in ['NG', 'NOT GIVEN', 'NOTGIVEN', 'N/A']:
-            return 'NOT GIVEN'
-        else:
-            # Return original if no mapping found
-            return answer_str
+        # Map variations to standard format with one dict probe
+        # Return original if no mapping found
+        return _TRUE_FALSE_VARIANTS.get(answer_str, answer_str)
     
-    def _normalize_text(self, text: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _normalize_text(text: str) -> str:
         """
         Normalize text for comparison.
         
         This method standardizes text by removing case differences,
         extra whitespace, and punctuation for better comparison.
         
+        Results are memoized by the text itself (a pure function, so the
+        cache never goes stale): the same correct answers are normalized
+        again for every student who takes the test.
+        
         Args:
             text: Text to normalize
             
@@ -1124,17 +928,24 @@ class AnswerComparisonService:
         if not text:
             return ''
         
+        # ASCII fast path: drop punctuation with one translate() and collapse
+        # whitespace with split()/join(), both in C. Runs of spaces left where
+        # punctuation was removed are collapsed too, which only affects the
+        # exact-match shortcut; the word-based similarity sees the same words
+        if text.isascii():
+            return ' '.join(text.lower().translate(_ASCII_PUNCTUATION_TABLE).split())
+        
         # Convert to lowercase for case-insensitive comparison
         text = text.lower()
         
         # Remove extra whitespace (multiple spaces, tabs, newlines)
         # Replace with single space
-        text = re.sub(r'\s+', ' ', text)
+        text = _WHITESPACE_RE.sub(' ', text)
         
         # Remove punctuation (optional - depends on your requirements)
         # This removes commas, periods, exclamation marks, etc.
         # Keep only letters, numbers, and spaces
-        text = re.sub(r'[^\w\s]', '', text)
+        text = _PUNCTUATION_RE.sub('', text)
         
         # Return trimmed text
         return text.strip()
@@ -1160,21 +971,22 @@ class AnswerComparisonService:
         if not text1 or not text2:
             return 0.0
         
-        # Split texts into words for comparison
-        words1 = set(text1.split())  # Convert to set for efficient operations
-        words2 = set(text2.split())
+        # Split texts into words for comparison (memoized per distinct text)
+        words1 = _word_set(text1)
+        words2 = _word_set(text2)
         
         # Handle case where both texts are empty
         if not words1 and not words2:
             return 1.0
         
-        # Calculate intersection (common words) and union (all words)
-        intersection = words1.intersection(words2)  # Words that appear in both texts
-        union = words1.union(words2)               # All unique words from both texts
+        # Count common words; the union size follows from the set sizes
+        # (|A ∪ B| = |A| + |B| - |A ∩ B|) without building the union set
+        common = len(words1 & words2)                  # Words that appear in both texts
+        union_size = len(words1) + len(words2) - common  # All unique words from both texts
         
         # Calculate Jaccard similarity: intersection size / union size
         # This gives a score between 0 and 1
-        return len(intersection) / len(union) if union else 0.0
+        return common / union_size if union_size else 0.0
     
     # =============================================================================
     # SUMMARY METHODS - Get overview of comparison results
@@ -1200,19 +1012,37 @@ class AnswerComparisonService:
             - processing status
         """
         
-        # Get all student answers for this submission
-        student_answers = submit_answer.get_student_answers()
+        # Count answers per question type in one grouped query
+        # Ordered by each type's first question so the breakdown keeps the
+        # order in which the types appear in the test
+        type_counts = submit_answer.get_student_answers().values(
+            'question_type__type'
+        ).annotate(
+            total=Count('pk'),                                 # Total questions of this type
+            correct=Count('pk', filter=Q(is_correct=True)),    # Correct answers of this type
+            first_question=Min('question_number'),
+        ).order_by('first_question')
+        
+        # Create breakdown by question type
+        # This shows how student performed on different types of questions
+        question_type_breakdown = {}
+        for row in type_counts:
+            question_type_breakdown[row['question_type__type']] = {
+                'total': row['total'],      # Total questions of this type
+                'correct': row['correct'],  # Correct answers of this type
+                'percentage': 0.0           # Success percentage for this type
+            }
         
         # Check if there are any answers to summarize
-        if not student_answers.exists():
+        if not question_type_breakdown:
             return {
                 'success': False,
                 'error': 'No answers found for this submission'
             }
         
-        # Count correct and incorrect answers
-        correct_count = student_answers.filter(is_correct=True).count()  # Count correct answers
-        total_count = student_answers.count()                            # Total questions answered
+        # Overall counts are the sums of the per-type counts
+        correct_count = sum(qt_data['correct'] for qt_data in question_type_breakdown.values())
+        total_count = sum(qt_data['total'] for qt_data in question_type_breakdown.values())
         
         # Calculate success percentage
         percentage = (correct_count / total_count * 100) if total_count > 0 else 0
@@ -1220,27 +1050,6 @@ class AnswerComparisonService:
         # Calculate IELTS band score using our scoring system
         ielts_band_score = self._calculate_ielts_band_score(correct_count, total_count)
         
-        # Create breakdown by question type
-        # This shows how student performed on different types of questions
-        question_type_breakdown = {}
-        
-        # Iterate through all answers to categorize by question type
-        for answer in student_answers:
-            question_type = answer.question_type.type  # Get question type name
-            
-            # Initialize breakdown for this question type if not exists
-            if question_type not in question_type_breakdown:
-                question_type_breakdown[question_type] = {
-                    'total': 0,        # Total questions of this type
-                    'correct': 0,      # Correct answers of this type
-                    'percentage': 0.0  # Success percentage for this type
-                }
-            
-            # Increment counters
-            question_type_breakdown[question_type]['total'] += 1
-            if answer.is_correct:
-                question_type_breakdown[question_type]['correct'] += 1
-        
         # Calculate percentage for each question type
         for qt_data in question_type_breakdown.values():
             # Calculate success percentage for this question type
@@ -1260,4 +1069,69 @@ class AnswerComparisonService:
             'ielts_band_score': ielts_band_score,              # Official IELTS band score
             'question_type_breakdown': question_type_breakdown, # Performance by question type
             # 'is_processed': submit_answer.is_processed          # Whether submission was processed
-        }
\ No newline at end of file
+        }
+    
+    # =============================================================================
+    # QUESTION TYPE HANDLERS - shared by all instances
+    # =============================================================================
+    
+    # Dictionary mapping question types to their comparison methods
+    # Key: Question type name (string)
+    # Value: Plain function, called as handler(self, student_answer, correct_answer)
+    # Built once when the class is created instead of binding 16 methods
+    # every time a service is instantiated. Yes/No/Not Given shares the
+    # T/F/NG comparison; the completion, short answer and matching types
+    # all use the generic fuzzy text comparison directly
+    _QUESTION_TYPE_HANDLERS = {
+        # Multiple choice questions with single correct answer
+        'Multiple Choice Questions (MCQ)': _compare_multiple_choice,
+        
+        # Multiple choice questions with multiple correct answers
+        'Multiple Choice Questions (Multiple Answer)': _compare_multiple_answer,
+        
+        # True/False/Not Given questions (common in IELTS)
+        'True/False/Not Given': _compare_true_false,
+        
+        # Yes/No/Not Given questions (same normalization as T/F/NG)
+        'Yes/No/Not Given': _compare_true_false,
+        
+        # Note completion questions (fill in the blanks)
+        'Note Completion': _compare_note_completion,
+        
+        # Sentence completion questions
+        'Sentence Completion': _compare_text_answer,
+        
+        # Summary completion questions
+        'Summary Completion': _compare_text_answer,
+        
+        # Table completion questions
+        'Table Completion': _compare_text_answer,
+        
+        # Flow chart completion questions
+        'Flow Chart Completion': _compare_text_answer,
+        
+        # Diagram label completion questions
+        'Diagram Label Completion': _compare_text_answer,
+        
+        # Short answer questions
+        'Short Answer Questions': _compare_text_answer,
+        
+        # Matching information questions
+        'Matching Information': _compare_text_answer,
+        
+        # Matching headings questions
+        'Matching Headings': _compare_text_answer,
+        
+        # Matching features questions
+        'Matching Features': _compare_text_answer,
+        
+        # Sentence matching questions
+        'Sentence Matching': _compare_text_answer,
+        
+        # Matching experts questions
+        'Matching Experts': _compare_text_answer,
+    }
+    
+    # Handlers that compare lists of answers; an enhanced answer dict without
+    # a student_answer field is passed to them as [] rather than ''
+    _LIST_ANSWER_HANDLERS = frozenset({_compare_multiple_answer, _compare_note_completion})
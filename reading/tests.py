@@ -1,3 +1,157 @@
+import uuid
+from types import SimpleNamespace
+
 from django.test import TestCase
+from rest_framework import serializers
+
+from reading.models import ReadingTest, Passage, QuestionType
+from reading.serializers import QuestionTypeSerializer
+from reading.services.answer_comparison_service import AnswerComparisonService
+
+
+class CorrectAnswerOrderingTests(TestCase):
+    """
+    The grading answer key must number questions exactly like the
+    passage/question type listing students see.
+    """
+
+    def setUp(self):
+        self.test = ReadingTest.objects.create(
+            test_name='Ordering', source='Test', organization_id='1'
+        )
+        self.passages = [
+            Passage.objects.create(test=self.test, title=f'P{n}', text='x' * 50, order=n)
+            for n in (2, 1)
+        ]
+
+    def _create_question_types(self, passage, prefix, count):
+        # order is left at its default (1), as the API does; primary keys
+        # descend so insertion order differs from the defined (order, pk) order
+        for i in range(count):
+            QuestionType.objects.create(
+                question_type_id=uuid.UUID(int=(passage.order << 8) + count - i),
+                passage=passage,
+                type='Short Answer Questions',
+                instruction_template='Questions {start}-{end}',
+                expected_range='1-1',
+                questions_data=[{'question_text': 'q', 'correct_answer': f'{prefix}{i}'}],
+            )
+
+    def _displayed_answers(self):
+        return [
+            question['correct_answer']
+            for passage in Passage.objects.filter(test=self.test)
+            for question_type in passage.questions.all()
+            for question in question_type.questions_data
+        ]
+
+    def test_tied_question_type_order_matches_display(self):
+        for passage in self.passages:
+            self._create_question_types(passage, f'p{passage.order}-ans', 6)
+
+        answers = AnswerComparisonService()._load_correct_answers_for_test(self.test.test_id)
+
+        self.assertEqual(list(answers), self._displayed_answers())
+        # Passage order first, then question types sharing an order by primary key
+        expected = tuple(
+            f'p{order}-ans{i}' for order in (1, 2) for i in reversed(range(6))
+        )
+        self.assertEqual(answers, expected)
+
+
+class QuestionOptionsValidationTests(TestCase):
+    """
+    Text options are converted to letters A-Z by position.
+    """
+
+    def _validate(self, options):
+        serializer = QuestionTypeSerializer(context={'question_type': 'Multiple Choice Questions (MCQ)'})
+        return serializer.validate_questions_data(
+            [{'question_text': 'q', 'correct_answer': 'A', 'options': options}]
+        )
+
+    def test_too_many_options_is_a_validation_error(self):
+        with self.assertRaises(serializers.ValidationError):
+            self._validate([f'option {n}' for n in range(27)])
+
+    def test_twenty_six_options_get_letters(self):
+        questions = self._validate([f'option {n}' for n in range(26)])
+        self.assertEqual(questions[0]['options'][-1], 'Z')
+        self.assertEqual(questions[0]['option_texts']['Z'], 'option 25')
+
+
+class CorrectAnswerDisplayTests(TestCase):
+    """
+    List correct answers are displayed from their own values.
+    """
+
+    def test_equal_lists_of_different_types_display_their_own_values(self):
+        service = AnswerComparisonService()
+
+        self.assertEqual(service._format_correct_answer([1, 2]), '1, 2')
+        self.assertEqual(service._format_correct_answer([1.0, 2.0]), '1.0, 2.0')
+        self.assertEqual(service._format_correct_answer([True]), 'True')
+
+
+class EnhancedAnswerUnwrapTests(TestCase):
+    """
+    An enhanced answer dict without a student_answer field is an empty list
+    for the list-based handlers and an empty string for the others.
+    """
+
+    def _is_correct(self, question_type, correct_answer):
+        student_answer = SimpleNamespace(
+            question_number=1,
+            question_type=SimpleNamespace(type=question_type),
+            student_answer={},
+        )
+        result = AnswerComparisonService()._compare_single_answer(
+            student_answer, (correct_answer,), test_id=None
+        )
+        return result['is_correct']
+
+    def test_missing_answer_does_not_fill_a_blank_note_gap(self):
+        self.assertFalse(self._is_correct('Note Completion', ''))
+
+    def test_missing_answer_is_blank_text(self):
+        self.assertTrue(self._is_correct('Short Answer Questions', ''))
+
+
+class NextQuestionNumberTests(TestCase):
+    """
+    The starting number for a new question type follows every question
+    already in this passage and the passages before it.
+    """
+
+    def setUp(self):
+        self.test = ReadingTest.objects.create(
+            test_name='Numbering', source='Test', organization_id='1'
+        )
+        self.first = Passage.objects.create(test=self.test, text='x' * 50, order=1)
+        self.second = Passage.objects.create(test=self.test, text='x' * 50, order=2)
+
+    def _add_questions(self, passage, count):
+        QuestionType.objects.create(
+            passage=passage,
+            type='Short Answer Questions',
+            instruction_template='Questions {start}-{end}',
+            expected_range='1-1',
+            questions_data=[{'question_text': 'q', 'correct_answer': 'a'}] * count,
+        )
+
+    def test_same_passage_instance_sees_new_question_types(self):
+        self._add_questions(self.first, 3)
+        self.assertEqual(self.second.get_next_question_number(), 4)
+
+        self._add_questions(self.second, 2)
+        self._add_questions(self.first, 1)
+        self.assertEqual(self.second.get_next_question_number(), 7)
+        self.assertEqual(self.first.get_next_question_number(), 5)
+
+    def test_prefetched_passages_give_the_same_number(self):
+        self._add_questions(self.first, 3)
+        self._add_questions(self.second, 2)
+        test = ReadingTest.objects.prefetch_related('passages__questions').get(pk=self.test.pk)
+        passage = test.passages.all()[0]
 
-# Create your tests here.
+        self.assertEqual(passage.get_next_question_number(), 4)
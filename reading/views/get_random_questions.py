@@ -90,17 +90,17 @@ class RandomQuestionsView(APIView):
             # STEP 4: RETRIEVE READING TESTS
             # =============================================================================
             # Get all tests for the organization
-            all_tests = ReadingTest.objects.filter(organization_id=organization_id)
+            # (fetched once; an empty list doubles as the existence check)
+            available_tests = list(ReadingTest.objects.filter(organization_id=organization_id))
             
             # Check if any tests exist
-            if not all_tests.exists():
+            if not available_tests:
                 logger.error(f"No reading tests found for organization {organization_id}")
                 return Response({
                     'error': 'No reading tests available for this organization'
                 }, status=status.HTTP_404_NOT_FOUND)
             
             # Select random tests (up to count)
-            available_tests = list(all_tests)
             if len(available_tests) > count:
                 random_reading = random.sample(available_tests, count)
             else:
@@ -109,8 +109,8 @@ class RandomQuestionsView(APIView):
             # Filter tests that have at least one passage (safety check)
             tests_with_passages = []
             for test in random_reading:
-                passage_count = Passage.objects.filter(test=test).count()
-                if passage_count > 0:
+                # Only existence matters here, so stop at the first passage
+                if Passage.objects.filter(test=test).exists():
                     tests_with_passages.append(test)
                 else:
                     # Log warning for tests without passages
@@ -141,11 +141,11 @@ class RandomQuestionsView(APIView):
                 complete_passages = []
                 for j, passage in enumerate(passages):
                     # Get question types for this passage
-                    question_types = QuestionType.objects.filter(passage=passage).order_by('order')
+                    question_types = QuestionType.objects.filter(passage=passage).order_by('order', 'pk')
                     
                     # Update student_range for all question types to ensure correct numbering
-                    for question_type in question_types:
-                        question_type.update_student_range()
+                    # (only changed ranges are written, in a single batched update)
+                    QuestionType.update_student_ranges(question_types)
                     
                     question_types_serializer = QuestionTypeSerializer(question_types, many=True)
                     
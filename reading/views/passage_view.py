@@ -140,7 +140,7 @@ class PassageView(APIView):
                 logger.info(f"Retrieving passage: {passage_id} for organization: {organization_id}")
                 
                 # Get the passage and verify test ownership
-                passage = get_object_or_404(Passage, passage_id=passage_id)
+                passage = get_object_or_404(Passage.objects.select_related('test'), passage_id=passage_id)
                 
                 # Check if the passage's test belongs to the user's organization
                 if passage.test.organization_id != organization_id:
@@ -223,7 +223,7 @@ class PassageView(APIView):
             organization_id = str(organization_id)
             
             # Get the passage and verify test ownership
-            passage = get_object_or_404(Passage, passage_id=passage_id)
+            passage = get_object_or_404(Passage.objects.select_related('test'), passage_id=passage_id)
             
             # Check if the passage's test belongs to the user's organization
             if passage.test.organization_id != organization_id:
@@ -288,7 +288,7 @@ class PassageView(APIView):
             organization_id = str(organization_id)
             
             # Get the passage and verify test ownership
-            passage = get_object_or_404(Passage, passage_id=passage_id)
+            passage = get_object_or_404(Passage.objects.select_related('test'), passage_id=passage_id)
             
             # Check if the passage's test belongs to the user's organization
             if passage.test.organization_id != organization_id:
@@ -12,6 +12,10 @@ from reading.permissions import SharedAuthPermission
 # Set up logging for debugging and monitoring
 logger = logging.getLogger(__name__)
 
+# Type names (display and slug) that get extra create-time debug logging.
+# A tuple rather than a frozenset: request data may hold unhashable values
+_DIAGRAM_LABEL_TYPES = ('Diagram Label Completion', 'diagram-label-completion')
+
 class QuestionTypeView(APIView):
     """
     API view for managing QuestionType objects.
@@ -65,7 +69,7 @@ class QuestionTypeView(APIView):
             
             # Verify that the passage belongs to the user's organization
             try:
-                passage = Passage.objects.get(passage_id=passage_id)
+                passage = Passage.objects.select_related('test').get(passage_id=passage_id)
                 if passage.test.organization_id != organization_id:
                     logger.warning(f"Unauthorized access attempt to passage {passage_id} by organization {organization_id}")
                     return Response({
@@ -77,7 +81,8 @@ class QuestionTypeView(APIView):
                 }, status=status.HTTP_404_NOT_FOUND)
             
             # Debug: Log request data for diagram label completion
-            if request.data.get('type') in ['Diagram Label Completion', 'diagram-label-completion']:
+            is_diagram_label = request.data.get('type') in _DIAGRAM_LABEL_TYPES
+            if is_diagram_label:
                 logger.info(f"=== DIAGRAM LABEL COMPLETION CREATE DEBUG ===")
                 logger.info(f"Request data type: {request.data.get('type')}")
                 logger.info(f"Request data expected_range: {request.data.get('expected_range')}")
@@ -91,7 +96,7 @@ class QuestionTypeView(APIView):
             )
             if serializer.is_valid():
                 # Debug: Log validated data
-                if request.data.get('type') in ['Diagram Label Completion', 'diagram-label-completion']:
+                if is_diagram_label:
                     logger.info(f"Validated data expected_range: {serializer.validated_data.get('expected_range')}")
                     logger.info(f"Validated data actual_count: {serializer.validated_data.get('actual_count')}")
                 
@@ -100,7 +105,7 @@ class QuestionTypeView(APIView):
                     question_type = serializer.save()
                     
                     # Debug: Log saved question type
-                    if question_type.type in ['Diagram Label Completion', 'diagram-label-completion']:
+                    if question_type.type in _DIAGRAM_LABEL_TYPES:
                         logger.info(f"Saved question_type.expected_range: {question_type.expected_range}")
                         logger.info(f"Saved question_type.actual_count: {question_type.actual_count}")
                 
@@ -154,7 +159,7 @@ class QuestionTypeView(APIView):
                 logger.info(f"Retrieving question type: {question_type_id} for organization: {organization_id}")
                 
                 # Get the question type and verify passage ownership
-                question_type = get_object_or_404(QuestionType, question_type_id=question_type_id)
+                question_type = get_object_or_404(QuestionType.objects.select_related('passage__test'), question_type_id=question_type_id)
                 
                 # Check if the question type's passage belongs to the user's organization
                 if question_type.passage.test.organization_id != organization_id:
@@ -180,7 +185,7 @@ class QuestionTypeView(APIView):
                 
                 # Verify that the passage belongs to the user's organization
                 try:
-                    passage = Passage.objects.get(passage_id=passage_id)
+                    passage = Passage.objects.select_related('test').get(passage_id=passage_id)
                     if passage.test.organization_id != organization_id:
                         logger.warning(f"Unauthorized access attempt to passage {passage_id} by organization {organization_id}")
                         return Response({
@@ -191,8 +196,10 @@ class QuestionTypeView(APIView):
                         'message': 'Passage not found'
                     }, status=status.HTTP_404_NOT_FOUND)
                 
-                # Get all question types for the passage
-                question_types = QuestionType.objects.filter(passage=passage)
+                # Get all question types for the passage, eager-loading what the serializer reads
+                question_types = QuestionTypeSerializer.setup_eager_loading(
+                    QuestionType.objects.filter(passage=passage)
+                )
                 
                 # Serialize the question types
                 serializer = QuestionTypeSerializer(question_types, many=True)
@@ -237,7 +244,7 @@ class QuestionTypeView(APIView):
             organization_id = str(organization_id)
             
             # Get the question type and verify passage ownership
-            question_type = get_object_or_404(QuestionType, question_type_id=question_type_id)
+            question_type = get_object_or_404(QuestionType.objects.select_related('passage__test'), question_type_id=question_type_id)
             
             # Check if the question type's passage belongs to the user's organization
             if question_type.passage.test.organization_id != organization_id:
@@ -307,7 +314,7 @@ class QuestionTypeView(APIView):
             organization_id = str(organization_id)
             
             # Get the question type and verify passage ownership
-            question_type = get_object_or_404(QuestionType, question_type_id=question_type_id)
+            question_type = get_object_or_404(QuestionType.objects.select_related('passage__test'), question_type_id=question_type_id)
             
             # Check if the question type's passage belongs to the user's organization
             if question_type.passage.test.organization_id != organization_id:
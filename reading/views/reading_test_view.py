@@ -145,7 +145,11 @@ class ReadingTestView(APIView):
                 logger.info(f"Retrieving all reading tests for organization: {organization_id}")
                 
                 # Get all tests for the organization
-                reading_tests = ReadingTest.objects.filter(organization_id=organization_id)
+                # (passages and question types are prefetched, so the computed
+                # counts are served from memory instead of per-test queries)
+                reading_tests = ReadingTestSerializer.setup_eager_loading(
+                    ReadingTest.objects.filter(organization_id=organization_id)
+                )
                 
                 # Serialize the tests
                 serializer = ReadingTestSerializer(reading_tests, many=True)
@@ -181,7 +181,7 @@ class SubmitStudentAnswersView(APIView):
                     # Build question number to question type mapping
                     question_counter = 1
                     for passage in reading_test.passages.all().order_by('order'):
-                        for question_type in passage.questions.all().order_by('order'):
+                        for question_type in passage.questions.all().order_by('order', 'pk'):
                             for question in question_type.questions_data:
                                 if question_counter <= 40:
                                     actual_question_types[question_counter] = {